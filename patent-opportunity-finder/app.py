@@ -278,7 +278,9 @@ with tab1:
                 combined += f"\n\n## {ctx.source_type.upper()}: {ctx.source_name}\n\n"
                 combined += ctx.summary + "\n\n"
                 for f in ctx.files[:20]:
-                    combined += f"### {f.path}\n```\n{f.content[:3000]}\n```\n\n"
+                    text = f.preview(3000)
+                    if text is not None:
+                        combined += f"### {f.path}\n```\n{text}\n```\n\n"
             st.code(combined[:50000], language="markdown")
             st.success("Context displayed above - copy as needed")
 
@@ -514,8 +516,11 @@ with tab4:
                         source_context += f"\n## {ctx.source_type.upper()}: {ctx.source_name}\n"
                         source_context += f"{ctx.summary}\n\n"
                         for f in ctx.files[:15]:  # Limit files per source
+                            text = f.preview(5000)  # Truncate long files
+                            if text is None:
+                                continue
                             source_context += f"### File: {f.path}\n```{f.language.lower() if f.language else ''}\n"
-                            source_context += f.content[:5000]  # Truncate long files
+                            source_context += text
                             source_context += "\n```\n\n"
 
                 with st.spinner("Generating patent application (this may take a minute)..."):
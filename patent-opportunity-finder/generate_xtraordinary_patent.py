@@ -307,23 +307,22 @@ def generate_diagrams():
         }
     ]
 
-    for i, spec in enumerate(diagram_specs, 1):
-        print(f"\nGenerating FIG. {i}: {spec['title']}...")
-        try:
-            img = krea.generate_patent_diagram(
-                spec["description"],
-                diagram_type=spec["type"],
-                style="technical_blueprint"
-            )
-            diagrams.append({
-                "figure_number": i,
-                "title": spec["title"],
-                "image": img,
-                "description": f"FIG. {i} illustrates {spec['title'].lower()} according to various embodiments."
-            })
-            print(f"  Generated: {img.filename} ({img.source})")
-        except Exception as e:
-            print(f"  Error generating diagram: {e}")
+    # Request all figures at once; results come back in figure order. Failed
+    # API calls come back as placeholder diagrams rather than raising
+    print(f"\nGenerating {len(diagram_specs)} figures...")
+    images = krea.generate_patent_diagrams([
+        (spec["description"], spec["type"], "technical_blueprint")
+        for spec in diagram_specs
+    ])
+
+    for i, (spec, img) in enumerate(zip(diagram_specs, images), 1):
+        diagrams.append({
+            "figure_number": i,
+            "title": spec["title"],
+            "image": img,
+            "description": f"FIG. {i} illustrates {spec['title'].lower()} according to various embodiments."
+        })
+        print(f"  FIG. {i}: {spec['title']} - {img.filename} ({img.source})")
 
     # Save diagrams
     output_dir = os.path.join(config.OUTPUT_DIR, "patent_figures")
@@ -1,92 +1,69 @@
 """
 Patent Opportunity Finder Modules
 =================================
+
+Public names are imported from their submodules on first access, so that
+importing one submodule does not also load python-docx, numba, aiohttp
+and the rest of the package's heavy dependencies.
 """
 
-from .prior_art_search import PriorArtSearcher, search_prior_art, find_white_space
-from .ai_providers import (
-    AIOrchestrator,
-    ClaudeProvider,
-    OpenAIProvider,
-    PerplexityProvider,
-    DiagramProvider,
-    YouTubeTranscriptProvider
-)
-from .opportunity_finder import OpportunityFinder, find_opportunities
-from .patent_drafter import PatentDrafter, draft_patent
-from .source_integrations import (
-    SourceManager,
-    SourceContext,
-    SourceFile,
-    LocalFolderScanner,
-    GitHubIntegration,
-    GoogleDriveIntegration,
-    scan_local_folder,
-    fetch_github_repo,
-    fetch_gdrive_folder
-)
-from .image_generator import (
-    PatentImageManager,
-    KreaAIGenerator,
-    PlaywrightCapture,
-    GeneratedImage,
-    generate_patent_figures
-)
-from .docx_generator import (
-    DocxPatentGenerator,
-    PatentDocument,
-    PatentFigure,
-    InventorInfo,
-    generate_patent_docx
-)
-from .rubric_scorer import (
-    RubricScorer,
-    ScoringResult,
-    score_patent
-)
-from .unified_pipeline import (
-    UnifiedPatentPipeline,
-    PipelineResult,
-    run_patent_pipeline
-)
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    'PriorArtSearcher': 'prior_art_search',
+    'search_prior_art': 'prior_art_search',
+    'find_white_space': 'prior_art_search',
+    'AIOrchestrator': 'ai_providers',
+    'ClaudeProvider': 'ai_providers',
+    'OpenAIProvider': 'ai_providers',
+    'PerplexityProvider': 'ai_providers',
+    'DiagramProvider': 'ai_providers',
+    'YouTubeTranscriptProvider': 'ai_providers',
+    'AICache': 'ai_cache',
+    'OpportunityFinder': 'opportunity_finder',
+    'find_opportunities': 'opportunity_finder',
+    'PatentDrafter': 'patent_drafter',
+    'draft_patent': 'patent_drafter',
+    'SourceManager': 'source_integrations',
+    'SourceContext': 'source_integrations',
+    'SourceFile': 'source_integrations',
+    'LocalFolderScanner': 'source_integrations',
+    'GitHubIntegration': 'source_integrations',
+    'GoogleDriveIntegration': 'source_integrations',
+    'scan_local_folder': 'source_integrations',
+    'fetch_github_repo': 'source_integrations',
+    'fetch_gdrive_folder': 'source_integrations',
+    'PatentImageManager': 'image_generator',
+    'KreaAIGenerator': 'image_generator',
+    'PlaywrightCapture': 'image_generator',
+    'GeneratedImage': 'image_generator',
+    'generate_patent_figures': 'image_generator',
+    'DocxPatentGenerator': 'docx_generator',
+    'PatentDocument': 'docx_generator',
+    'PatentFigure': 'docx_generator',
+    'InventorInfo': 'docx_generator',
+    'generate_patent_docx': 'docx_generator',
+    'RubricScorer': 'rubric_scorer',
+    'ScoringResult': 'rubric_scorer',
+    'score_patent': 'rubric_scorer',
+    'score_patents': 'rubric_scorer',
+    'UnifiedPatentPipeline': 'unified_pipeline',
+    'PipelineResult': 'unified_pipeline',
+    'run_patent_pipeline': 'unified_pipeline',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
 
-__all__ = [
-    'PriorArtSearcher',
-    'search_prior_art',
-    'find_white_space',
-    'AIOrchestrator',
-    'ClaudeProvider',
-    'OpenAIProvider',
-    'PerplexityProvider',
-    'DiagramProvider',
-    'YouTubeTranscriptProvider',
-    'OpportunityFinder',
-    'find_opportunities',
-    'PatentDrafter',
-    'draft_patent',
-    'SourceManager',
-    'SourceContext',
-    'SourceFile',
-    'LocalFolderScanner',
-    'GitHubIntegration',
-    'GoogleDriveIntegration',
-    'scan_local_folder',
-    'fetch_github_repo',
-    'fetch_gdrive_folder',
-    'PatentImageManager',
-    'KreaAIGenerator',
-    'PlaywrightCapture',
-    'GeneratedImage',
-    'generate_patent_figures',
-    'DocxPatentGenerator',
-    'PatentDocument',
-    'PatentFigure',
-    'InventorInfo',
-    'generate_patent_docx',
-    'RubricScorer',
-    'ScoringResult',
-    'score_patent',
-    'UnifiedPatentPipeline',
-    'PipelineResult',
-    'run_patent_pipeline'
-]
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
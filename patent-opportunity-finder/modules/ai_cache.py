@@ -0,0 +1,119 @@
+"""
+AI Cache Module
+===============
+Disk-backed memoization of AI calls, keyed on a hash of the full request,
+so pipeline re-runs and retries do not re-issue identical prompts.
+"""
+
+import os
+import json
+import time
+import hashlib
+import tempfile
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, Optional
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional - keys are then serialized with the stdlib encoder
+    orjson = None
+
+
+class AICache:
+    """
+    Cache of successful AI responses (as dicts), one JSON file per request.
+
+    Concurrent calls with the same key share a single in-flight request.
+    """
+
+    CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache",
+                             "patent-opportunity-finder", "ai")
+
+    # Seconds a cached response stays valid
+    TTL = 24 * 60 * 60
+
+    def __init__(self, cache_dir: Optional[str] = None, ttl: Optional[int] = None):
+        self.cache_dir = cache_dir or self.CACHE_DIR
+        self.ttl = self.TTL if ttl is None else ttl
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+
+    @staticmethod
+    def make_key(**request) -> str:
+        """Stable hash of a request (provider, prompt, model, max_tokens, ...)"""
+        # Both encoders produce the same compact UTF-8 form, so keys do not
+        # depend on whether orjson is installed
+        if orjson is not None:
+            payload = orjson.dumps(request, default=str, option=orjson.OPT_SORT_KEYS)
+        else:
+            payload = json.dumps(request, sort_keys=True, default=str,
+                                 separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        return hashlib.blake2b(payload, digest_size=32).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key + ".json")
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Cached response for key, or None if missing or expired"""
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl:
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, value: Dict) -> None:
+        """Store a response; written atomically so readers never see partial files"""
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        except OSError:
+            return  # Caching is best-effort
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(value, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError):
+            # Do not leave the partial temp file behind
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def memoize(self, key: str, compute: Callable[[], Dict]) -> Dict:
+        """
+        Return the cached response for key, or compute it.
+
+        Only responses with a truthy "success" field are stored, so failed
+        calls are retried next time.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            value = compute()
+            if value.get("success"):
+                self.set(key, value)
+            future.set_result(value)
+            return value
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
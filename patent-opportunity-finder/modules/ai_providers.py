@@ -6,11 +6,14 @@ Unified interface for Claude, OpenAI, Perplexity, and diagram generation APIs.
 
 import os
 import requests
+from requests.adapters import HTTPAdapter
 import json
 from typing import Optional, List, Dict, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from abc import ABC, abstractmethod
 
+from .ai_cache import AICache
+
 
 @dataclass
 class AIResponse:
@@ -38,9 +41,13 @@ class ClaudeProvider(AIProvider):
     """
 
     API_URL = "https://api.anthropic.com/v1/messages"
+    DEFAULT_MODEL = "claude-sonnet-4-20250514"
 
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, session: Optional[requests.Session] = None):
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
+        self.model = self.DEFAULT_MODEL
+        # Keep-alive session; AIOrchestrator passes one shared pooled session
+        self.session = session or requests.Session()
         if not self.api_key:
             raise ValueError("ANTHROPIC_API_KEY required")
 
@@ -48,7 +55,7 @@ class ClaudeProvider(AIProvider):
         self,
         prompt: str,
         system_prompt: str = None,
-        model: str = "claude-sonnet-4-20250514",
+        model: str = None,
         max_tokens: int = 4096,
         temperature: float = 0.7,
         **kwargs
@@ -59,10 +66,12 @@ class ClaudeProvider(AIProvider):
         Args:
             prompt: User message
             system_prompt: System instructions
-            model: Model to use (claude-sonnet-4-20250514, claude-opus-4-20250514, etc.)
+            model: Model to use (claude-sonnet-4-20250514, claude-opus-4-20250514, etc.);
+                defaults to self.model
             max_tokens: Maximum tokens in response
             temperature: Creativity (0-1)
         """
+        model = model or self.model
         headers = {
             "x-api-key": self.api_key,
             "anthropic-version": "2023-06-01",
@@ -84,7 +93,7 @@ class ClaudeProvider(AIProvider):
             payload["temperature"] = temperature
 
         try:
-            response = requests.post(self.API_URL, headers=headers, json=payload, timeout=120)
+            response = self.session.post(self.API_URL, headers=headers, json=payload, timeout=120)
             response.raise_for_status()
             data = response.json()
 
@@ -119,9 +128,13 @@ class OpenAIProvider(AIProvider):
     """
 
     API_URL = "https://api.openai.com/v1/chat/completions"
+    DEFAULT_MODEL = "gpt-4o"
 
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, session: Optional[requests.Session] = None):
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+        self.model = self.DEFAULT_MODEL
+        # Keep-alive session; AIOrchestrator passes one shared pooled session
+        self.session = session or requests.Session()
         if not self.api_key:
             raise ValueError("OPENAI_API_KEY required")
 
@@ -129,12 +142,13 @@ class OpenAIProvider(AIProvider):
         self,
         prompt: str,
         system_prompt: str = None,
-        model: str = "gpt-4o",
+        model: str = None,
         max_tokens: int = 4096,
         temperature: float = 0.7,
         **kwargs
     ) -> AIResponse:
         """Generate response using OpenAI API"""
+        model = model or self.model
 
         headers = {
             "Authorization": f"Bearer {self.api_key}",
@@ -154,7 +168,7 @@ class OpenAIProvider(AIProvider):
         }
 
         try:
-            response = requests.post(self.API_URL, headers=headers, json=payload, timeout=120)
+            response = self.session.post(self.API_URL, headers=headers, json=payload, timeout=120)
             response.raise_for_status()
             data = response.json()
 
@@ -187,9 +201,13 @@ class PerplexityProvider(AIProvider):
     """
 
     API_URL = "https://api.perplexity.ai/chat/completions"
+    DEFAULT_MODEL = "sonar"
 
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, session: Optional[requests.Session] = None):
         self.api_key = api_key or os.getenv("PERPLEXITY_API_KEY")
+        self.model = self.DEFAULT_MODEL
+        # Keep-alive session; AIOrchestrator passes one shared pooled session
+        self.session = session or requests.Session()
         if not self.api_key:
             raise ValueError("PERPLEXITY_API_KEY required")
 
@@ -197,12 +215,13 @@ class PerplexityProvider(AIProvider):
         self,
         prompt: str,
         system_prompt: str = None,
-        model: str = "sonar",
+        model: str = None,
         max_tokens: int = 4096,
         temperature: float = 0.7,
         **kwargs
     ) -> AIResponse:
         """Generate response using Perplexity API (with web search)"""
+        model = model or self.model
 
         headers = {
             "Authorization": f"Bearer {self.api_key}",
@@ -220,7 +239,7 @@ class PerplexityProvider(AIProvider):
         }
 
         try:
-            response = requests.post(self.API_URL, headers=headers, json=payload, timeout=120)
+            response = self.session.post(self.API_URL, headers=headers, json=payload, timeout=120)
             response.raise_for_status()
             data = response.json()
 
@@ -443,36 +462,56 @@ class AIOrchestrator:
     Orchestrates multiple AI providers for patent generation workflow
     """
 
+    # Pooled keep-alive connections per host, shared by all providers
+    POOL_SIZE = 16
+
     def __init__(
         self,
         claude_key: str = None,
         openai_key: str = None,
         perplexity_key: str = None,
-        diagram_key: str = None
+        diagram_key: str = None,
+        cache: Optional[AICache] = None,
+        session: Optional[requests.Session] = None
     ):
+        # Optional response cache; None disables memoization
+        self.cache = cache
+
+        # One session for every provider so TCP/TLS connections are reused
+        # across calls, including the concurrent research passes
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=self.POOL_SIZE, pool_maxsize=self.POOL_SIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
         self.providers = {}
 
         if claude_key or os.getenv("ANTHROPIC_API_KEY"):
             try:
-                self.providers["claude"] = ClaudeProvider(claude_key)
+                self.providers["claude"] = ClaudeProvider(claude_key, self.session)
             except ValueError:
                 pass
 
         if openai_key or os.getenv("OPENAI_API_KEY"):
             try:
-                self.providers["openai"] = OpenAIProvider(openai_key)
+                self.providers["openai"] = OpenAIProvider(openai_key, self.session)
             except ValueError:
                 pass
 
         if perplexity_key or os.getenv("PERPLEXITY_API_KEY"):
             try:
-                self.providers["perplexity"] = PerplexityProvider(perplexity_key)
+                self.providers["perplexity"] = PerplexityProvider(perplexity_key, self.session)
             except ValueError:
                 pass
 
         self.diagram = DiagramProvider(diagram_key)
         self.youtube = YouTubeTranscriptProvider()
 
+    def close(self):
+        """Close pooled provider connections"""
+        self.session.close()
+
     def get_available_providers(self) -> List[str]:
         """Return list of configured providers"""
         return list(self.providers.keys())
@@ -498,15 +537,26 @@ class AIOrchestrator:
                 )
             provider = available[0]
 
-        return self.providers[provider].generate(prompt, system_prompt, **kwargs)
+        # The resolved model is part of the key, so changing a provider's
+        # default model does not return the old model's responses
+        request = {**kwargs, "model": kwargs.get("model") or self.providers[provider].model}
+        return self._cached(
+            lambda: self.providers[provider].generate(prompt, system_prompt, **kwargs),
+            method="generate", provider=provider, prompt=prompt,
+            system_prompt=system_prompt, **request
+        )
 
     def research(self, topic: str) -> AIResponse:
         """Use Perplexity for research (falls back to Claude)"""
         if "perplexity" in self.providers:
-            return self.providers["perplexity"].research(topic)
+            return self._cached(lambda: self.providers["perplexity"].research(topic),
+                                method="research", provider="perplexity", prompt=topic,
+                                model=self.providers["perplexity"].model)
         elif "claude" in self.providers:
             system = "You are a patent research expert. Provide detailed analysis."
-            return self.providers["claude"].generate(topic, system)
+            return self._cached(lambda: self.providers["claude"].generate(topic, system),
+                                method="research", provider="claude", prompt=topic,
+                                model=self.providers["claude"].model)
         else:
             return AIResponse(
                 content="",
@@ -517,6 +567,13 @@ class AIOrchestrator:
                 error="No research provider available"
             )
 
+    def _cached(self, call, **request) -> AIResponse:
+        """Run call(), reusing a cached response for an identical request"""
+        if self.cache is None:
+            return call()
+        key = AICache.make_key(**request)
+        return AIResponse(**self.cache.memoize(key, lambda: asdict(call())))
+
 
 # Convenience functions
 def get_orchestrator(**keys) -> AIOrchestrator:
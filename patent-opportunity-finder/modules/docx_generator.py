@@ -35,6 +35,7 @@ class PatentFigure:
     image_data: bytes  # Raw image bytes
     image_format: str  # png, jpg, svg
     reference_numerals: Dict[int, str] = field(default_factory=dict)
+    image_path: Optional[str] = None  # Image file on disk; used instead of image_data
 
 
 @dataclass
@@ -49,7 +50,7 @@ class InventorInfo:
     entity_type: str = "Micro Entity"  # Micro Entity, Small Entity, Large Entity
 
 
-@dataclass
+@dataclass(slots=True)
 class PatentDocument:
     """Complete patent document structure"""
     title: str
@@ -390,16 +391,16 @@ class DocxPatentGenerator:
 
             # Try to embed image
             try:
-                if fig.image_data and len(fig.image_data) > 0:
+                if fig.image_path or fig.image_data:
                     if fig.image_format.lower() == 'svg':
                         # SVG placeholder - needs conversion
                         placeholder = self.doc.add_paragraph()
                         placeholder.add_run(f"[SVG Figure - See attached file: FIG_{fig.figure_number}.svg]").italic = True
                         placeholder.alignment = WD_ALIGN_PARAGRAPH.CENTER
                     else:
-                        # Embed PNG/JPG
-                        image_stream = io.BytesIO(fig.image_data)
-                        self.doc.add_picture(image_stream, width=Inches(6.0))
+                        # Embed PNG/JPG; python-docx reads a path directly
+                        image = fig.image_path or io.BytesIO(fig.image_data)
+                        self.doc.add_picture(image, width=Inches(6.0))
 
                         # Center the image
                         last_paragraph = self.doc.paragraphs[-1]
@@ -508,7 +509,8 @@ def generate_patent_docx(
             description=fig.get('description', ''),
             image_data=fig.get('image_data', b''),
             image_format=fig.get('image_format', 'png'),
-            reference_numerals=fig.get('reference_numerals', {})
+            reference_numerals=fig.get('reference_numerals', {}),
+            image_path=fig.get('image_path')
         ))
 
     # Create patent document
@@ -15,6 +15,7 @@ import json
 import base64
 import requests
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, List, Tuple
 from dataclasses import dataclass
 from pathlib import Path
@@ -50,6 +51,9 @@ class KreaAIGenerator:
     KREA_API = "https://api.krea.ai/v1/generate"
     NANOBANANA_API = "https://api.nanobanana.com/v1/images/generate"
 
+    # Diagram requests in flight at once in generate_patent_diagrams
+    MAX_CONCURRENT = 5
+
     def __init__(self, api_key: Optional[str] = None, provider: str = "krea"):
         self.api_key = api_key or os.getenv("KREA_API_KEY")
         self.provider = provider
@@ -89,6 +93,30 @@ class KreaAIGenerator:
             print(f"Image generation error: {e}")
             return self._generate_placeholder(description, diagram_type)
 
+    def generate_patent_diagrams(
+        self,
+        specs: List[Tuple[str, str, str]],
+        size: Tuple[int, int] = (1024, 768)
+    ) -> List[GeneratedImage]:
+        """
+        Generate several diagrams concurrently.
+
+        Args:
+            specs: (description, diagram_type, style) per diagram
+            size: (width, height) tuple
+
+        Returns:
+            One GeneratedImage per spec, in the same order
+        """
+        if not self.api_key or len(specs) < 2:
+            # Placeholders are rendered locally; nothing to overlap
+            return [self.generate_patent_diagram(d, t, s, size) for d, t, s in specs]
+
+        with ThreadPoolExecutor(max_workers=min(self.MAX_CONCURRENT, len(specs))) as pool:
+            futures = [pool.submit(self.generate_patent_diagram, d, t, s, size)
+                       for d, t, s in specs]
+        return [future.result() for future in futures]
+
     def _build_patent_prompt(self, description: str, diagram_type: str, style: str) -> str:
         """Build an optimized prompt for patent diagram generation"""
 
@@ -576,6 +604,16 @@ class PatentImageManager:
         self.generated_images.append(img)
         return img
 
+    def generate_standard_diagrams(self, description: str) -> List[GeneratedImage]:
+        """Generate the system diagram, flowchart and block diagram in one batch"""
+        images = self.krea.generate_patent_diagrams([
+            (description, "system_architecture", "technical_blueprint"),
+            (f"Process flow for {description}", "flowchart", "line_art"),
+            (f"Hardware implementation of {description}", "block_diagram", "schematic"),
+        ])
+        self.generated_images.extend(images)
+        return images
+
     def capture_reference_webpage(self, url: str) -> Optional[GeneratedImage]:
         """Capture a webpage for reference"""
         img = self.playwright.capture_webpage(url)
@@ -653,9 +691,7 @@ def generate_patent_figures(
     manager = PatentImageManager(krea_api_key)
 
     # Generate standard diagrams
-    manager.generate_system_diagram(invention_description)
-    manager.generate_flowchart(f"Process flow for {invention_description}")
-    manager.generate_block_diagram(f"Hardware implementation of {invention_description}")
+    manager.generate_standard_diagrams(invention_description)
 
     # Capture code snippets
     if code_snippets:
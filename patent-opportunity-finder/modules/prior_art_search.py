@@ -6,14 +6,87 @@ Search USPTO PatentsView API for prior art related to invention ideas.
 
 import requests
 import json
+import re
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
-from dataclasses import dataclass, asdict
-
-
-@dataclass
+from dataclasses import dataclass, asdict, field
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional - fall back to the stdlib encoder
+    orjson = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    # numba is optional - the scoring kernel runs as plain Python without it
+    prange = range
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+# Token pattern used for relevance ranking
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def _json_dumps(obj) -> str:
+    """Serialize to a JSON string, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _json_loads(data):
+    """Parse JSON from str/bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@njit(parallel=True, cache=True)
+def bm25_scores(q_ids, indices, indptr, doc_lens, idf, k1, b, out):
+    """
+    Compute BM25 scores for every document in a CSR token matrix.
+
+    Args:
+        q_ids: Unique query token ids (int32)
+        indices: Concatenated token ids of all documents (int32)
+        indptr: Document offsets into indices, length n_docs + 1
+        doc_lens: Token count per document
+        idf: Inverse document frequency per token id
+        k1, b: BM25 tuning parameters
+        out: Output array receiving one score per document
+    """
+    n_docs = len(indptr) - 1
+    avgdl = doc_lens.sum() / n_docs if n_docs > 0 else 0.0
+    if avgdl == 0.0:
+        avgdl = 1.0
+
+    for d in prange(n_docs):
+        start = indptr[d]
+        end = indptr[d + 1]
+        norm = k1 * (1.0 - b + b * doc_lens[d] / avgdl)
+        score = 0.0
+        for qi in range(len(q_ids)):
+            q = q_ids[qi]
+            tf = 0
+            for j in range(start, end):
+                if indices[j] == q:
+                    tf += 1
+            if tf > 0:
+                score += idf[q] * (tf * (k1 + 1.0)) / (tf + norm)
+        out[d] = score
+
+
+@dataclass(slots=True)
 class Patent:
-    """Represents a patent from search results"""
+    """Represents a patent from search results (slotted: no per-instance __dict__)"""
     patent_number: str
     title: str
     abstract: str
@@ -34,6 +107,22 @@ class PriorArtReport:
     total_found: int
     patents: List[Patent]
     summary: str
+    # Struct-of-arrays view of `patents` for vectorized aggregation
+    assignee_ids: Optional[np.ndarray] = None
+    citation_counts: Optional[np.ndarray] = None
+    patent_dates: Optional[np.ndarray] = None
+    # Raw 'patents' records from the API response, kept for to_dataframe()
+    _raw: List[Dict] = field(default_factory=list, repr=False)
+
+    def to_dataframe(self):
+        """
+        Return the raw search results as a pandas DataFrame.
+
+        Built directly from the API records (one level of nested fields
+        flattened) without going through the Patent objects.
+        """
+        import pandas as pd
+        return pd.json_normalize(self._raw, max_level=1)
 
 
 class PriorArtSearcher:
@@ -58,8 +147,44 @@ class PriorArtSearcher:
         "database": "G06F16"
     }
 
+    # Fields requested from PatentsView (identical for every search)
+    FIELDS = [
+        "patent_number",
+        "patent_title",
+        "patent_abstract",
+        "patent_date",
+        "application.filing_date",
+        "assignees_at_grant.assignee_organization",
+        "citedby_patent_count",
+        "cpc_current.cpc_subgroup_id",
+        "cpc_current.cpc_subgroup_title"
+    ]
+
+    # Pre-serialized constant query parameters
+    _FIELDS_JSON = _json_dumps(FIELDS)
+    _SORT_CITATIONS_JSON = _json_dumps([{"citedby_patent_count": "desc"}])
+    _SORT_DATE_JSON = _json_dumps([{"patent_date": "desc"}])
+
     def __init__(self):
         self.session = requests.Session()
+        # Assignee name <-> integer id, shared across searches
+        self._assignee_interner: Dict[str, int] = {}
+        self._assignee_names: List[str] = []
+        # Canonical instances of repeated strings (e.g. CPC codes)
+        self._str_intern: Dict[str, str] = {}
+
+    def _intern_str(self, value: str) -> str:
+        """Return the canonical instance of a repeated string"""
+        return self._str_intern.setdefault(value, value)
+
+    def _intern_assignee(self, name: str) -> int:
+        """Return the integer id for an assignee name, assigning one if new"""
+        assignee_id = self._assignee_interner.get(name)
+        if assignee_id is None:
+            assignee_id = len(self._assignee_names)
+            self._assignee_interner[name] = assignee_id
+            self._assignee_names.append(name)
+        return assignee_id
 
     def search_by_keywords(
         self,
@@ -186,34 +311,20 @@ class PriorArtSearcher:
     ) -> PriorArtReport:
         """Execute the search query and return formatted results"""
 
-        fields = [
-            "patent_number",
-            "patent_title",
-            "patent_abstract",
-            "patent_date",
-            "application.filing_date",
-            "assignees_at_grant.assignee_organization",
-            "citedby_patent_count",
-            "cpc_current.cpc_subgroup_id",
-            "cpc_current.cpc_subgroup_title"
-        ]
-
         options = {"size": min(max_results, 1000)}
 
-        sort_order = [{"citedby_patent_count": "desc"}] if sort_by_citations else [{"patent_date": "desc"}]
-
         params = {
-            "q": json.dumps(query),
-            "f": json.dumps(fields),
-            "o": json.dumps(options),
-            "s": json.dumps(sort_order)
+            "q": _json_dumps(query),
+            "f": self._FIELDS_JSON,
+            "o": _json_dumps(options),
+            "s": self._SORT_CITATIONS_JSON if sort_by_citations else self._SORT_DATE_JSON
         }
 
         try:
             response = self.session.get(self.BASE_URL, params=params, timeout=30)
             response.raise_for_status()
-            data = response.json()
-        except requests.exceptions.RequestException as e:
+            data = _json_loads(response.content)
+        except (requests.exceptions.RequestException, ValueError) as e:
             return PriorArtReport(
                 query=search_terms,
                 technology_area=technology_area,
@@ -223,15 +334,19 @@ class PriorArtSearcher:
                 summary=f"Search failed: {str(e)}"
             )
 
+        raw_patents = data.get('patents') or []
         patents = []
-        for p in data.get('patents', []):
-            # Extract assignee
+        assignee_ids = []
+        for p in raw_patents:
+            # Extract assignee (one shared str object per distinct name)
             assignees = p.get('assignees_at_grant', [])
             assignee = assignees[0].get('assignee_organization', 'Individual') if assignees else 'Individual'
+            assignee_id = self._intern_assignee(assignee)
+            assignee = self._assignee_names[assignee_id]
 
             # Extract CPC codes
             cpc_list = p.get('cpc_current', [])
-            cpc_codes = [c.get('cpc_subgroup_id', '') for c in cpc_list[:5]]
+            cpc_codes = [self._intern_str(c.get('cpc_subgroup_id', '')) for c in cpc_list[:5]]
 
             patent = Patent(
                 patent_number=p.get('patent_number', ''),
@@ -244,16 +359,22 @@ class PriorArtSearcher:
                 url=f"https://patents.google.com/patent/US{p.get('patent_number', '')}"
             )
             patents.append(patent)
+            assignee_ids.append(assignee_id)
+
+        # Parallel arrays alongside the Patent list
+        assignee_arr = np.asarray(assignee_ids, dtype=np.int32)
+        citation_arr = np.asarray([p.citations or 0 for p in patents], dtype=np.int32)
+        date_arr = np.asarray([p.date or 'NaT' for p in patents], dtype='datetime64[D]')
 
         # Generate summary
         total = data.get('total_hits', len(patents))
-        top_assignees = self._get_top_assignees(patents)
+        top_assignees = self._get_top_assignees(assignee_arr)
 
         summary = f"Found {total} patents matching '{search_terms}' in {technology_area}. "
         if top_assignees:
             summary += f"Top assignees: {', '.join(top_assignees[:3])}. "
         if patents:
-            avg_citations = sum(p.citations for p in patents) / len(patents)
+            avg_citations = citation_arr.mean()
             summary += f"Average citations: {avg_citations:.1f}."
 
         return PriorArtReport(
@@ -262,18 +383,76 @@ class PriorArtSearcher:
             search_date=datetime.now().isoformat(),
             total_found=total,
             patents=patents,
-            summary=summary
+            summary=summary,
+            assignee_ids=assignee_arr,
+            citation_counts=citation_arr,
+            patent_dates=date_arr,
+            _raw=raw_patents
         )
 
-    def _get_top_assignees(self, patents: List[Patent]) -> List[str]:
-        """Get most common assignees from patent list"""
-        assignee_counts = {}
-        for p in patents:
-            if p.assignee != 'Individual':
-                assignee_counts[p.assignee] = assignee_counts.get(p.assignee, 0) + 1
+    def _get_top_assignees(self, assignee_ids: np.ndarray, top_n: int = 5) -> List[str]:
+        """Get most common assignees from an array of interned assignee ids"""
+        if len(assignee_ids) == 0:
+            return []
+
+        # Distinct ids with their count and first position in this report
+        ids, first_seen, counts = np.unique(assignee_ids, return_index=True,
+                                            return_counts=True)
+        keep = ids != self._assignee_interner.get('Individual', -1)
+        ids, first_seen, counts = ids[keep], first_seen[keep], counts[keep]
+
+        # Most common first; ties keep their order of appearance in the report
+        ranked = ids[np.lexsort((first_seen, -counts))][:top_n]
+        return [self._assignee_names[i] for i in ranked]
+
+    def rank_patents(
+        self,
+        query: str,
+        patents: List[Patent],
+        k1: float = 1.5,
+        b: float = 0.75
+    ) -> List[Patent]:
+        """
+        Rank patents (e.g. merged from several reports) by BM25 relevance
+
+        Titles and abstracts are tokenized once into a CSR layout
+        (indices, indptr) and scored by the compiled bm25_scores kernel.
+        Fills in Patent.relevance_score and returns patents sorted by it.
+        """
+        if not patents:
+            return []
+
+        vocab: Dict[str, int] = {}
+        token_ids = []
+        indptr = np.zeros(len(patents) + 1, dtype=np.int64)
+        for i, p in enumerate(patents):
+            tokens = _TOKEN_RE.findall(f"{p.title} {p.abstract}".lower())
+            token_ids.extend(vocab.setdefault(t, len(vocab)) for t in tokens)
+            indptr[i + 1] = len(token_ids)
+
+        indices = np.asarray(token_ids, dtype=np.int32)
+        doc_lens = np.diff(indptr).astype(np.float64)
+
+        # Document frequency: count each token at most once per document
+        df = np.zeros(len(vocab), dtype=np.float64)
+        for i in range(len(patents)):
+            df[np.unique(indices[indptr[i]:indptr[i + 1]])] += 1
+        n_docs = len(patents)
+        idf = np.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+
+        q_ids = np.asarray(
+            sorted({vocab[t] for t in _TOKEN_RE.findall(query.lower()) if t in vocab}),
+            dtype=np.int32
+        )
+
+        scores = np.zeros(n_docs, dtype=np.float64)
+        if len(q_ids):
+            bm25_scores(q_ids, indices, indptr, doc_lens, idf, k1, b, scores)
+
+        for p, score in zip(patents, scores):
+            p.relevance_score = float(score)
 
-        sorted_assignees = sorted(assignee_counts.items(), key=lambda x: x[1], reverse=True)
-        return [a[0] for a in sorted_assignees[:5]]
+        return sorted(patents, key=lambda p: p.relevance_score, reverse=True)
 
 
 def search_prior_art(keywords: str, technology: str = "ai") -> PriorArtReport:
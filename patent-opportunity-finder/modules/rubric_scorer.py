@@ -17,10 +17,79 @@ Categories:
 - Red Flag Deductions
 """
 
-from typing import Tuple, Dict, List
+from typing import Tuple, Dict, List, Iterable, Optional
 from dataclasses import dataclass
+from collections import OrderedDict
+from functools import lru_cache
+from multiprocessing import Pool
+import threading
 import re
 
+try:
+    import ahocorasick
+except ImportError:
+    # pyahocorasick is optional - keyword counts fall back to str.count
+    ahocorasick = None
+
+
+# Algorithm-disclosure markers. "at step"/"at block" only consume "at " so the
+# following "step N"/"block N" is still counted, matching separate scans of
+# each pattern; "input.*output" spans a line and is counted on its own.
+_ALGO_RE = re.compile(r"at (?=step|block)|step \d+|block \d+|algorithm|pseudocode")
+_INPUT_OUTPUT_RE = re.compile(r"input.*output")
+
+# 3-digit reference numerals (e.g. 101, 302)
+_NUMERAL_RE = re.compile(r'\b[1-9]\d{2}\b')
+
+# Performance claims such as "10x faster"
+_SPEEDUP_RE = re.compile(r'\d+x faster')
+
+
+def _extract(doc) -> Tuple[str, str, str, List, List, str]:
+    """
+    Read the six scored sections from a patent document.
+
+    Documents are expected to expose every section as a plain attribute
+    (as PatentDocument does); objects missing any of them fall back to
+    per-attribute getattr with empty defaults.
+    """
+    try:
+        return (doc.detailed_description or '', doc.summary or '',
+                doc.background or '', doc.claims or [], doc.figures or [],
+                doc.abstract or '')
+    except AttributeError:
+        return (getattr(doc, 'detailed_description', '') or '',
+                getattr(doc, 'summary', '') or '',
+                getattr(doc, 'background', '') or '',
+                getattr(doc, 'claims', []) or [],
+                getattr(doc, 'figures', []) or [],
+                getattr(doc, 'abstract', '') or '')
+
+
+class _KeywordCounts(dict):
+    """Keyword -> occurrence count in a text; unknown keywords are counted on lookup"""
+
+    def __init__(self, text: str, keyword_bytes: Optional[Dict[str, bytes]] = None):
+        super().__init__()
+        self.text = text
+        self._keyword_bytes = keyword_bytes or {}
+        self._encoded = None
+
+    def __missing__(self, keyword: str) -> int:
+        text, key = self.text, keyword
+        if not text.isascii():
+            # Curly quotes or dashes widen a str to 2-4 bytes per char; scan
+            # a 1-byte latin-1 copy instead. Each char still maps to one byte
+            # and keywords are ASCII, so the counts are unchanged.
+            if self._encoded is None:
+                self._encoded = text.encode('latin-1', 'replace')
+            text = self._encoded
+            key = self._keyword_bytes.get(keyword) or keyword.encode('latin-1')
+
+        count = text.count(key)
+        self[keyword] = count
+        return count
+
 
 @dataclass
 class ScoringResult:
@@ -55,6 +124,87 @@ class RubricScorer:
         (0, "Major Rework Required")
     ]
 
+    # Drafts with a shorter detailed description are not scored in full
+    MIN_DESCRIPTION_CHARS = 200
+
+    # Keyword groups - matched as substrings of the lowercased text
+    HOW_KEYWORDS = ("step", "process", "method", "comprise", "perform", "execute",
+                    "receive", "transmit", "generate", "transform", "calculate")
+    HARDWARE_KEYWORDS = ("processor", "memory", "cpu", "gpu", "tpu", "storage",
+                         "network interface", "computing device", "server", "client")
+    EXAMPLE_KEYWORDS = ("example", "embodiment")
+    FIGURE_KEYWORDS = ("fig.", "figure")
+    PRIOR_ART_INDICATORS = ("conventional", "existing", "prior", "traditional",
+                            "known", "previous", "current systems")
+    DIFF_INDICATORS = ("improvement", "novel", "unique", "different", "unlike",
+                       "advantage", "better", "superior", "overcome")
+    PROBLEM_INDICATORS = ("problem", "challenge", "limitation", "need", "issue")
+    SOLUTION_INDICATORS = ("solution", "address", "overcome", "provide", "solve")
+    VARIATION_INDICATORS = ("embodiment", "alternative", "variation", "optionally",
+                            "in some", "in various", "in another", "additionally")
+    FUTURE_INDICATORS = ("future", "extension", "enhancement", "further",
+                         "additionally", "moreover", "second generation")
+    BROAD_INDICATORS = ("various embodiments", "in general")
+    NARROW_INDICATORS = ("specific embodiment", "in particular")
+    DEPLOY_INDICATORS = ("deploy", "server", "cloud", "infrastructure",
+                         "architecture", "distributed", "hosted", "cluster")
+    TECH_INDICATORS = ("api", "database", "framework", "protocol", "json",
+                       "http", "rest", "queue", "cache")
+    USE_INDICATORS = ("example", "use case", "walkthrough", "scenario", "user")
+    PRACTICAL_INDICATORS = ("improvement", "reduce", "increase", "optimize",
+                            "enhance", "faster", "more efficient", "less memory")
+    MARKETING_WORDS = ("revolutionary", "best", "amazing", "groundbreaking",
+                       "world-class", "cutting-edge", "game-changing")
+    VAGUE_AI_PHRASES = ("uses ai", "uses machine learning", "leverages ai")
+    SPECIFIC_AI_TERMS = ("neural network", "transformer", "model", "training", "inference")
+    HARDWARE_PRESENCE_TERMS = ("processor", "memory", "cpu", "gpu", "computing device")
+    WORKAROUND_TERMS = ("workaround", "design around")
+    OTHER_TERMS = ("some embodiments",)
+
+    # Figure-title keywords (matched against lowercased figure titles)
+    SYSTEM_FIGURE_TERMS = ("system", "architecture", "network")
+    HARDWARE_FIGURE_TERMS = ("hardware", "block", "computing")
+    FLOWCHART_FIGURE_TERMS = ("flowchart", "method", "process")
+    UI_FIGURE_TERMS = ("interface", "ui", "screen", "mockup", "display")
+    DATA_FLOW_FIGURE_TERMS = ("data flow", "data", "pipeline")
+
+    KEYWORD_GROUPS = (
+        HOW_KEYWORDS, HARDWARE_KEYWORDS, EXAMPLE_KEYWORDS, FIGURE_KEYWORDS,
+        PRIOR_ART_INDICATORS, DIFF_INDICATORS, PROBLEM_INDICATORS, SOLUTION_INDICATORS,
+        VARIATION_INDICATORS, FUTURE_INDICATORS, BROAD_INDICATORS, NARROW_INDICATORS,
+        DEPLOY_INDICATORS, TECH_INDICATORS, USE_INDICATORS, PRACTICAL_INDICATORS,
+        MARKETING_WORDS, VAGUE_AI_PHRASES, SPECIFIC_AI_TERMS, HARDWARE_PRESENCE_TERMS,
+        WORKAROUND_TERMS, OTHER_TERMS
+    )
+
+    def __init__(self):
+        self._keywords = tuple(sorted({kw for group in self.KEYWORD_GROUPS for kw in group}))
+        self._keyword_bytes = {kw: kw.encode('latin-1') for kw in self._keywords}
+
+        # One automaton for every keyword lets a text be counted in a single pass
+        self._automaton = None
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for kw in self._keywords:
+                self._automaton.add_word(kw, (kw, len(kw)))
+            self._automaton.make_automaton()
+
+    def _count_keywords(self, text: str) -> Dict[str, int]:
+        """Count non-overlapping occurrences of every rubric keyword in text"""
+        counts = _KeywordCounts(text, self._keyword_bytes)
+        if self._automaton is None:
+            return counts
+
+        counts.update(dict.fromkeys(self._keywords, 0))
+        last_end = {}
+        for end, (kw, length) in self._automaton.iter(text):
+            # Skip matches overlapping the previous one, as str.count does
+            if end - length < last_end.get(kw, -1):
+                continue
+            last_end[kw] = end
+            counts[kw] += 1
+        return counts
+
     def score(self, patent_doc) -> ScoringResult:
         """
         Score a patent document against the rubric.
@@ -65,24 +215,69 @@ class RubricScorer:
         Returns:
             ScoringResult with total score, grade, and details
         """
+        # Get text content for analysis (the abstract is not scored)
+        detailed_desc, summary, background, claims, figures, _ = _extract(patent_doc)
+
+        # Fast path for incomplete drafts: nothing else can lift the score
+        # meaningfully until the detailed description is written
+        if len(detailed_desc) < self.MIN_DESCRIPTION_CHARS:
+            return ScoringResult(
+                total_score=0,
+                grade="Major Rework Required",
+                category_scores={},
+                deductions={},
+                bonuses={},
+                recommendations=["CRITICAL: Add a detailed description - the draft is too short to score"]
+            )
+
+        # Lowercased figure titles, materialized once for every helper
+        fig_titles = tuple((getattr(f, 'title', '') or '').lower() for f in figures)
+
+        # Re-scoring an unchanged draft is a cache hit
+        key = (type(self), detailed_desc, summary, background, tuple(claims), fig_titles)
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable section content - score without the cache
+            key = None
+
+        if key is not None:
+            with _score_cache_lock:
+                cached = _score_cache.get(key)
+                if cached is not None:
+                    _score_cache.move_to_end(key)
+            if cached is not None:
+                return _copy_result(cached)
+
+        result = self._score_sections(detailed_desc, summary, background, claims, fig_titles)
+
+        if key is not None:
+            # The cache keeps its own copy; callers may modify what they get
+            with _score_cache_lock:
+                _score_cache[key] = _copy_result(result)
+                while len(_score_cache) > _SCORE_CACHE_SIZE:
+                    _score_cache.popitem(last=False)
+        return result
+
+    def _score_sections(self, detailed_desc: str, summary: str, background: str,
+                        claims, fig_titles: Tuple[str, ...]) -> ScoringResult:
+        """Score the extracted sections of one patent document"""
         category_scores = {}
         deductions = {}
         bonuses = {}
         recommendations = []
 
-        # Get text content for analysis
-        detailed_desc = getattr(patent_doc, 'detailed_description', '') or ''
-        summary = getattr(patent_doc, 'summary', '') or ''
-        background = getattr(patent_doc, 'background', '') or ''
-        claims = getattr(patent_doc, 'claims', []) or []
-        figures = getattr(patent_doc, 'figures', []) or []
-        abstract = getattr(patent_doc, 'abstract', '') or ''
+        # Lowercase each section once; helpers receive the lowercased text
+        desc_lower = detailed_desc.lower()
+        full_text = f"{desc_lower} {summary.lower()} {background.lower()}"
 
-        full_text = f"{detailed_desc} {summary} {background}".lower()
+        # Count every keyword once per text; helpers only read the counts
+        desc_counts = self._count_keywords(desc_lower)
+        text_counts = self._count_keywords(full_text)
 
         # 1. Technical Disclosure Quality (30 pts max)
         tech_score, tech_details, tech_recs = self._score_technical_disclosure(
-            detailed_desc, full_text
+            desc_lower, desc_counts
         )
         category_scores['technical_disclosure'] = {
             'score': tech_score,
@@ -92,7 +287,7 @@ class RubricScorer:
         recommendations.extend(tech_recs)
 
         # 2. Drawings & Figures (20 pts max)
-        fig_score, fig_details, fig_recs = self._score_drawings(figures)
+        fig_score, fig_details, fig_recs = self._score_drawings(fig_titles)
         category_scores['drawings_figures'] = {
             'score': fig_score,
             'max': 20,
@@ -101,7 +296,7 @@ class RubricScorer:
         recommendations.extend(fig_recs)
 
         # 3. Novelty & Differentiation (15 pts max)
-        nov_score, nov_details, nov_recs = self._score_novelty(full_text, summary)
+        nov_score, nov_details, nov_recs = self._score_novelty(text_counts)
         category_scores['novelty_differentiation'] = {
             'score': nov_score,
             'max': 15,
@@ -110,7 +305,7 @@ class RubricScorer:
         recommendations.extend(nov_recs)
 
         # 4. Scope & Protection (15 pts max)
-        scope_score, scope_details, scope_recs = self._score_scope(detailed_desc)
+        scope_score, scope_details, scope_recs = self._score_scope(desc_counts)
         category_scores['scope_protection'] = {
             'score': scope_score,
             'max': 15,
@@ -119,7 +314,7 @@ class RubricScorer:
         recommendations.extend(scope_recs)
 
         # 5. Implementation Details (10 pts max)
-        impl_score, impl_details, impl_recs = self._score_implementation(detailed_desc)
+        impl_score, impl_details, impl_recs = self._score_implementation(desc_counts)
         category_scores['implementation_details'] = {
             'score': impl_score,
             'max': 10,
@@ -128,7 +323,7 @@ class RubricScorer:
         recommendations.extend(impl_recs)
 
         # 6. AI-Specific Requirements (10 pts max)
-        ai_score, ai_details, ai_recs = self._score_ai_specific(detailed_desc, full_text)
+        ai_score, ai_details, ai_recs = self._score_ai_specific(desc_counts)
         category_scores['ai_specific'] = {
             'score': ai_score,
             'max': 10,
@@ -137,10 +332,10 @@ class RubricScorer:
         recommendations.extend(ai_recs)
 
         # Check for red flags
-        deductions = self._check_red_flags(full_text, figures, detailed_desc)
+        deductions = self._check_red_flags(text_counts, fig_titles, detailed_desc, desc_counts)
 
         # Check for bonuses
-        bonuses = self._check_bonuses(claims, detailed_desc, full_text)
+        bonuses = self._check_bonuses(claims, desc_lower, desc_counts)
 
         # Calculate totals
         base_score = sum(cat['score'] for cat in category_scores.values())
@@ -165,16 +360,14 @@ class RubricScorer:
             recommendations=recommendations[:10]  # Top 10 recommendations
         )
 
-    def _score_technical_disclosure(self, detailed_desc: str, full_text: str) -> Tuple[int, Dict, List]:
+    def _score_technical_disclosure(self, desc_lower: str,
+                                    desc_counts: Dict[str, int]) -> Tuple[int, Dict, List]:
         """Score technical disclosure quality (30 pts max)"""
         details = {}
         recommendations = []
-        desc_lower = detailed_desc.lower()
 
         # HOW not WHAT (8 pts)
-        how_keywords = ["step", "process", "method", "comprise", "perform", "execute",
-                       "receive", "transmit", "generate", "transform", "calculate"]
-        how_count = sum(desc_lower.count(kw) for kw in how_keywords)
+        how_count = sum(desc_counts[kw] for kw in self.HOW_KEYWORDS)
 
         if how_count >= 25:
             details['how_not_what'] = 8
@@ -187,9 +380,7 @@ class RubricScorer:
             recommendations.append("Add more HOW details - describe step-by-step processes, not just outcomes")
 
         # Hardware context (6 pts)
-        hw_keywords = ["processor", "memory", "cpu", "gpu", "tpu", "storage",
-                      "network interface", "computing device", "server", "client"]
-        hw_count = sum(desc_lower.count(kw) for kw in hw_keywords)
+        hw_count = sum(desc_counts[kw] for kw in self.HARDWARE_KEYWORDS)
 
         if hw_count >= 15:
             details['hardware_context'] = 6
@@ -202,9 +393,7 @@ class RubricScorer:
             recommendations.append("Add hardware context - mention processor, memory, storage, network")
 
         # Algorithm disclosure (8 pts)
-        algo_patterns = [r"step \d+", r"at step", r"block \d+", r"at block",
-                        r"algorithm", r"pseudocode", r"input.*output"]
-        algo_count = sum(len(re.findall(p, desc_lower)) for p in algo_patterns)
+        algo_count = len(_ALGO_RE.findall(desc_lower)) + len(_INPUT_OUTPUT_RE.findall(desc_lower))
 
         if algo_count >= 12:
             details['algorithm_disclosure'] = 8
@@ -217,9 +406,9 @@ class RubricScorer:
             recommendations.append("Add step-by-step algorithm descriptions with numbered steps")
 
         # Enablement (8 pts) - based on comprehensiveness
-        word_count = len(detailed_desc.split())
-        has_examples = "example" in desc_lower or "embodiment" in desc_lower
-        has_figures = "fig." in desc_lower or "figure" in desc_lower
+        word_count = len(desc_lower.split())
+        has_examples = any(desc_counts[kw] for kw in self.EXAMPLE_KEYWORDS)
+        has_figures = any(desc_counts[kw] for kw in self.FIGURE_KEYWORDS)
 
         enablement_score = 0
         if word_count >= 3000:
@@ -247,35 +436,33 @@ class RubricScorer:
         total = sum(details.values())
         return min(total, 30), details, recommendations
 
-    def _score_drawings(self, figures: List) -> Tuple[int, Dict, List]:
-        """Score drawings & figures (20 pts max)"""
+    def _score_drawings(self, fig_titles: Tuple[str, ...]) -> Tuple[int, Dict, List]:
+        """Score drawings & figures (20 pts max) from lowercased figure titles"""
         details = {}
         recommendations = []
-        fig_count = len(figures) if figures else 0
+        fig_count = len(fig_titles)
 
         if fig_count == 0:
             recommendations.append("CRITICAL: Add at least 3-5 figures (system, hardware, flowchart)")
             return 0, {'no_figures': True}, recommendations
 
-        # Extract figure titles for analysis
-        fig_titles = [getattr(f, 'title', '').lower() for f in figures]
         all_titles = ' '.join(fig_titles)
 
         # System diagram (5 pts)
-        has_system = any(kw in all_titles for kw in ['system', 'architecture', 'network'])
+        has_system = any(kw in all_titles for kw in self.SYSTEM_FIGURE_TERMS)
         details['system_diagram'] = 5 if has_system else 0
         if not has_system:
             recommendations.append("Add system architecture diagram (FIG. 1)")
 
         # Hardware block diagram (4 pts)
-        has_hardware = any(kw in all_titles for kw in ['hardware', 'block', 'computing'])
+        has_hardware = any(kw in all_titles for kw in self.HARDWARE_FIGURE_TERMS)
         details['hardware_block_diagram'] = 4 if has_hardware else 0
         if not has_hardware:
             recommendations.append("Add hardware block diagram showing processor, memory, etc.")
 
         # Method flowcharts (6 pts)
         flowchart_count = sum(1 for t in fig_titles
-                             if 'flowchart' in t or 'method' in t or 'process' in t)
+                              if any(kw in t for kw in self.FLOWCHART_FIGURE_TERMS))
         if flowchart_count >= 2:
             details['method_flowcharts'] = 6
         elif flowchart_count >= 1:
@@ -285,11 +472,11 @@ class RubricScorer:
             recommendations.append("Add method flowchart(s) showing process steps")
 
         # Interface mockups (3 pts)
-        has_ui = any(kw in all_titles for kw in ['interface', 'ui', 'screen', 'mockup', 'display'])
+        has_ui = any(kw in all_titles for kw in self.UI_FIGURE_TERMS)
         details['interface_mockups'] = 3 if has_ui else 1  # 1 point if N/A
 
         # Data flow diagram (2 pts)
-        has_data_flow = any(kw in all_titles for kw in ['data flow', 'data', 'pipeline'])
+        has_data_flow = any(kw in all_titles for kw in self.DATA_FLOW_FIGURE_TERMS)
         details['data_flow_diagram'] = 2 if has_data_flow else 0
         if not has_data_flow:
             recommendations.append("Consider adding data flow diagram")
@@ -297,15 +484,13 @@ class RubricScorer:
         total = sum(details.values())
         return min(total, 20), details, recommendations
 
-    def _score_novelty(self, full_text: str, summary: str) -> Tuple[int, Dict, List]:
+    def _score_novelty(self, text_counts: Dict[str, int]) -> Tuple[int, Dict, List]:
         """Score novelty & differentiation (15 pts max)"""
         details = {}
         recommendations = []
 
         # Prior art awareness (5 pts)
-        prior_indicators = ["conventional", "existing", "prior", "traditional",
-                          "known", "previous", "current systems"]
-        pa_count = sum(full_text.count(kw) for kw in prior_indicators)
+        pa_count = sum(text_counts[kw] for kw in self.PRIOR_ART_INDICATORS)
 
         if pa_count >= 5:
             details['prior_art_awareness'] = 5
@@ -316,9 +501,7 @@ class RubricScorer:
             recommendations.append("Acknowledge prior art and existing approaches")
 
         # Point of difference (5 pts)
-        diff_indicators = ["improvement", "novel", "unique", "different", "unlike",
-                         "advantage", "better", "superior", "overcome"]
-        diff_count = sum(full_text.count(kw) for kw in diff_indicators)
+        diff_count = sum(text_counts[kw] for kw in self.DIFF_INDICATORS)
 
         if diff_count >= 8:
             details['point_of_difference'] = 5
@@ -329,8 +512,8 @@ class RubricScorer:
             recommendations.append("Clearly state what makes this invention different/better")
 
         # Problem-solution (5 pts)
-        has_problem = any(kw in full_text for kw in ["problem", "challenge", "limitation", "need", "issue"])
-        has_solution = any(kw in full_text for kw in ["solution", "address", "overcome", "provide", "solve"])
+        has_problem = any(text_counts[kw] for kw in self.PROBLEM_INDICATORS)
+        has_solution = any(text_counts[kw] for kw in self.SOLUTION_INDICATORS)
 
         if has_problem and has_solution:
             details['problem_solution'] = 5
@@ -343,16 +526,13 @@ class RubricScorer:
         total = sum(details.values())
         return min(total, 15), details, recommendations
 
-    def _score_scope(self, detailed_desc: str) -> Tuple[int, Dict, List]:
+    def _score_scope(self, desc_counts: Dict[str, int]) -> Tuple[int, Dict, List]:
         """Score scope & protection (15 pts max)"""
         details = {}
         recommendations = []
-        desc_lower = detailed_desc.lower()
 
         # Workarounds & variations (8 pts)
-        variation_indicators = ["embodiment", "alternative", "variation", "optionally",
-                               "in some", "in various", "in another", "additionally"]
-        var_count = sum(desc_lower.count(kw) for kw in variation_indicators)
+        var_count = sum(desc_counts[kw] for kw in self.VARIATION_INDICATORS)
 
         if var_count >= 20:
             details['workarounds_variations'] = 8
@@ -365,9 +545,7 @@ class RubricScorer:
             recommendations.append("Add more alternative embodiments and variations")
 
         # Future variations (4 pts)
-        future_indicators = ["future", "extension", "enhancement", "further",
-                            "additionally", "moreover", "second generation"]
-        future_count = sum(desc_lower.count(kw) for kw in future_indicators)
+        future_count = sum(desc_counts[kw] for kw in self.FUTURE_INDICATORS)
 
         if future_count >= 4:
             details['future_variations'] = 4
@@ -378,12 +556,12 @@ class RubricScorer:
             recommendations.append("Describe future improvements and extensions")
 
         # Broad-to-narrow (3 pts)
-        has_broad = "various embodiments" in desc_lower or "in general" in desc_lower
-        has_narrow = "specific embodiment" in desc_lower or "in particular" in desc_lower
+        has_broad = any(desc_counts[kw] for kw in self.BROAD_INDICATORS)
+        has_narrow = any(desc_counts[kw] for kw in self.NARROW_INDICATORS)
 
         if has_broad and has_narrow:
             details['broad_to_narrow'] = 3
-        elif has_broad or "some embodiments" in desc_lower:
+        elif has_broad or desc_counts["some embodiments"]:
             details['broad_to_narrow'] = 2
         else:
             details['broad_to_narrow'] = 0
@@ -392,16 +570,13 @@ class RubricScorer:
         total = sum(details.values())
         return min(total, 15), details, recommendations
 
-    def _score_implementation(self, detailed_desc: str) -> Tuple[int, Dict, List]:
+    def _score_implementation(self, desc_counts: Dict[str, int]) -> Tuple[int, Dict, List]:
         """Score implementation details (10 pts max)"""
         details = {}
         recommendations = []
-        desc_lower = detailed_desc.lower()
 
         # Deployment architecture (5 pts)
-        deploy_indicators = ["deploy", "server", "cloud", "infrastructure",
-                            "architecture", "distributed", "hosted", "cluster"]
-        deploy_count = sum(desc_lower.count(kw) for kw in deploy_indicators)
+        deploy_count = sum(desc_counts[kw] for kw in self.DEPLOY_INDICATORS)
 
         if deploy_count >= 6:
             details['deployment_architecture'] = 5
@@ -412,9 +587,7 @@ class RubricScorer:
             recommendations.append("Describe deployment architecture and infrastructure")
 
         # Technology stack (3 pts)
-        tech_indicators = ["api", "database", "framework", "protocol", "json",
-                         "http", "rest", "queue", "cache"]
-        tech_count = sum(desc_lower.count(kw) for kw in tech_indicators)
+        tech_count = sum(desc_counts[kw] for kw in self.TECH_INDICATORS)
 
         if tech_count >= 5:
             details['technology_stack'] = 3
@@ -425,23 +598,19 @@ class RubricScorer:
             recommendations.append("Mention technology stack components")
 
         # Real world use (2 pts)
-        use_indicators = ["example", "use case", "walkthrough", "scenario", "user"]
-        has_use = any(kw in desc_lower for kw in use_indicators)
+        has_use = any(desc_counts[kw] for kw in self.USE_INDICATORS)
         details['real_world_use'] = 2 if has_use else 1
 
         total = sum(details.values())
         return min(total, 10), details, recommendations
 
-    def _score_ai_specific(self, detailed_desc: str, full_text: str) -> Tuple[int, Dict, List]:
+    def _score_ai_specific(self, desc_counts: Dict[str, int]) -> Tuple[int, Dict, List]:
         """Score AI-specific requirements (10 pts max)"""
         details = {}
         recommendations = []
-        desc_lower = detailed_desc.lower()
 
         # Practical application (4 pts)
-        practical_indicators = ["improvement", "reduce", "increase", "optimize",
-                               "enhance", "faster", "more efficient", "less memory"]
-        pract_count = sum(desc_lower.count(kw) for kw in practical_indicators)
+        pract_count = sum(desc_counts[kw] for kw in self.PRACTICAL_INDICATORS)
 
         if pract_count >= 6:
             details['practical_application'] = 4
@@ -452,13 +621,13 @@ class RubricScorer:
             recommendations.append("Emphasize practical technical improvements")
 
         # Not abstract (3 pts) - hardware integration
-        has_processor = "processor" in desc_lower
-        has_memory = "memory" in desc_lower
+        has_processor = desc_counts["processor"] > 0
+        has_memory = desc_counts["memory"] > 0
         has_hw = has_processor and has_memory
 
         if has_hw:
             details['not_abstract'] = 3
-        elif has_processor or "computing device" in desc_lower:
+        elif has_processor or desc_counts["computing device"]:
             details['not_abstract'] = 2
         else:
             details['not_abstract'] = 0
@@ -470,14 +639,13 @@ class RubricScorer:
         total = sum(details.values())
         return min(total, 10), details, recommendations
 
-    def _check_red_flags(self, full_text: str, figures: List, detailed_desc: str) -> Dict[str, int]:
+    def _check_red_flags(self, text_counts: Dict[str, int], figures: Tuple, detailed_desc: str,
+                         desc_counts: Dict[str, int]) -> Dict[str, int]:
         """Check for red flag deductions"""
         deductions = {}
 
         # Marketing language (-10)
-        marketing_words = ["revolutionary", "best", "amazing", "groundbreaking",
-                         "world-class", "cutting-edge", "game-changing"]
-        if any(word in full_text for word in marketing_words):
+        if any(text_counts[word] for word in self.MARKETING_WORDS):
             deductions["marketing_language"] = -10
 
         # No drawings (-10)
@@ -485,52 +653,74 @@ class RubricScorer:
             deductions["no_drawings"] = -10
 
         # Vague AI/ML (-8)
-        vague_ai = ("uses ai" in full_text or "uses machine learning" in full_text or
-                   "leverages ai" in full_text)
-        specific_ai = any(kw in full_text for kw in
-                         ["neural network", "transformer", "model", "training", "inference"])
+        vague_ai = any(text_counts[kw] for kw in self.VAGUE_AI_PHRASES)
+        specific_ai = any(text_counts[kw] for kw in self.SPECIFIC_AI_TERMS)
         if vague_ai and not specific_ai:
             deductions["vague_ai_ml"] = -8
 
         # No hardware context (-10)
-        has_hardware = any(kw in detailed_desc.lower() for kw in
-                          ["processor", "memory", "cpu", "gpu", "computing device"])
+        has_hardware = any(desc_counts[kw] for kw in self.HARDWARE_PRESENCE_TERMS)
         if not has_hardware:
             deductions["no_hardware_context"] = -10
 
         # Missing reference numerals (-3)
-        has_numerals = bool(re.search(r'\b[1-9]\d{2}\b', detailed_desc))  # 3-digit numbers
+        has_numerals = bool(_NUMERAL_RE.search(detailed_desc))  # 3-digit numbers
         if not has_numerals:
             deductions["missing_reference_numerals"] = -3
 
         return deductions
 
-    def _check_bonuses(self, claims: List, detailed_desc: str, full_text: str) -> Dict[str, int]:
+    def _check_bonuses(self, claims: List, desc_lower: str,
+                       desc_counts: Dict[str, int]) -> Dict[str, int]:
         """Check for bonus points"""
         bonuses = {}
-        desc_lower = detailed_desc.lower()
 
         # Informal claims included (+3)
         if claims and len(claims) >= 5:
             bonuses["informal_claims"] = 3
 
         # Multiple embodiments (+3)
-        embodiment_count = desc_lower.count("embodiment")
+        embodiment_count = desc_counts["embodiment"]
         if embodiment_count >= 5:
             bonuses["multiple_embodiments"] = 3
 
         # Performance benchmarks (+2)
-        has_metrics = "%" in detailed_desc or re.search(r'\d+x faster', desc_lower)
+        has_metrics = "%" in desc_lower or _SPEEDUP_RE.search(desc_lower)
         if has_metrics:
             bonuses["performance_benchmarks"] = 2
 
         # Competitive workaround analysis (+2)
-        if "workaround" in desc_lower or "design around" in desc_lower:
+        if any(desc_counts[kw] for kw in self.WORKAROUND_TERMS):
             bonuses["competitive_workaround"] = 2
 
         return bonuses
 
 
+# (scorer class, scored sections) -> result, most recently used last
+_SCORE_CACHE_SIZE = 256
+_score_cache: "OrderedDict[tuple, ScoringResult]" = OrderedDict()
+_score_cache_lock = threading.Lock()
+
+
+def _copy_result(result: ScoringResult) -> ScoringResult:
+    """Copy of a result's containers, down to each category's details"""
+    return ScoringResult(
+        total_score=result.total_score,
+        grade=result.grade,
+        category_scores={name: {**category, 'details': dict(category['details'])}
+                         for name, category in result.category_scores.items()},
+        deductions=dict(result.deductions),
+        bonuses=dict(result.bonuses),
+        recommendations=list(result.recommendations)
+    )
+
+
+@lru_cache(maxsize=None)
+def _shared_scorer(scorer_cls) -> RubricScorer:
+    """One scorer per class; building the keyword tables is the costly part"""
+    return scorer_cls()
+
+
 def score_patent(patent_doc) -> Dict:
     """
     Convenience function to score a patent document.
@@ -541,8 +731,7 @@ def score_patent(patent_doc) -> Dict:
     Returns:
         Dictionary with score details
     """
-    scorer = RubricScorer()
-    result = scorer.score(patent_doc)
+    result = _shared_scorer(RubricScorer).score(patent_doc)
 
     return {
         "score": result.total_score,
@@ -554,6 +743,32 @@ def score_patent(patent_doc) -> Dict:
     }
 
 
+def score_patents(patent_docs: Iterable, workers: Optional[int] = None,
+                  chunksize: int = 8) -> List[Dict]:
+    """
+    Score many patent documents in parallel worker processes.
+
+    Scoring is CPU-bound text scanning, so threads would serialize on the GIL;
+    each document is scored in a separate process instead. Process start-up
+    dominates for small batches, so use score_patent directly for a handful
+    of documents.
+
+    Args:
+        patent_docs: Picklable patent document objects
+        workers: Number of processes (defaults to the CPU count)
+        chunksize: Documents sent to a worker per task
+
+    Returns:
+        List of score dictionaries (as from score_patent), in input order
+    """
+    patent_docs = list(patent_docs)
+    if workers == 1 or len(patent_docs) <= 1:
+        return [score_patent(doc) for doc in patent_docs]
+
+    with Pool(workers) as pool:
+        return list(pool.imap(score_patent, patent_docs, chunksize=chunksize))
+
+
 if __name__ == "__main__":
     # Test the scorer with sample data
     print("Testing Rubric Scorer...")
@@ -6,25 +6,81 @@ to gather context for patent analysis and drafting.
 """
 
 import os
+import re
 import json
+import asyncio
 import requests
 import subprocess
-from typing import List, Dict, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from typing import Callable, List, Dict, Optional, Tuple
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import cached_property, partial
+from itertools import islice
 from pathlib import Path
 import tempfile
 import shutil
+import threading
+import time
+
+try:
+    import aiohttp
+except ImportError:
+    # aiohttp is optional - GitHub file contents are then fetched on a thread pool
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional - JSON exports fall back to the stdlib encoder
+    orjson = None
 
 
 @dataclass
 class SourceFile:
-    """Represents a file from any source"""
+    """
+    Represents a file from any source.
+
+    content may be None together with a content_loader; load_content() then
+    fetches the text on demand. preview(n) returns a prefix without
+    materializing the whole file when a preview_loader is available.
+    Both return None for a file whose text could not be loaded.
+    """
     path: str
     name: str
-    content: str
+    content: Optional[str]
     source_type: str  # local, github, gdrive
     size: int
     language: Optional[str] = None
+    content_loader: Optional[Callable[[], Optional[str]]] = field(
+        default=None, repr=False, compare=False)
+    preview_loader: Optional[Callable[[int], Optional[str]]] = field(
+        default=None, repr=False, compare=False)
+
+    def load_content(self) -> Optional[str]:
+        """Full text, loaded through content_loader on first call"""
+        if self.content is None and self.content_loader is not None:
+            try:
+                # A failed load stays None and is retried on the next call
+                self.content = self.content_loader()
+            except Exception:
+                return None
+        return self.content
+
+    def preview(self, n: int) -> Optional[str]:
+        """First n characters of the content"""
+        if self.content is None and self.preview_loader is not None:
+            try:
+                text = self.preview_loader(n)
+            except Exception:
+                # Fall back to loading the whole file
+                text = None
+            if text is not None:
+                return text[:n]
+        text = self.load_content()
+        return text[:n] if text is not None else None
 
 
 @dataclass
@@ -38,6 +94,54 @@ class SourceContext:
     summary: str
     structure: Dict
 
+    # Files and characters per file covered by truncated_files
+    PREVIEW_FILES = 25
+    PREVIEW_CHARS = 6000
+
+    @cached_property
+    def truncated_files(self) -> Tuple[Tuple[str, Optional[str], str], ...]:
+        """
+        (path, language, text prefix) for the leading files, computed once
+        so prompt builders share one truncated copy of each file.
+        """
+        previews = ((f.path, f.language, f.preview(self.PREVIEW_CHARS))
+                    for f in self.files[:self.PREVIEW_FILES])
+        # Files whose text could not be loaded are left out
+        return tuple(entry for entry in previews if entry[2] is not None)
+
+
+class _InflightCalls:
+    """Let concurrent callers with the same key share one in-progress call"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[object, Future] = {}
+
+    def run(self, key, func, *args):
+        """Call func(*args), or wait for the identical call already running"""
+        with self._lock:
+            future = self._calls.get(key)
+            if future is None:
+                future = self._calls[key] = Future()
+                leader = True
+            else:
+                leader = False
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = func(*args)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
 
 # =============================================================================
 # LOCAL FOLDER INTEGRATION
@@ -71,8 +175,34 @@ class LocalFolderScanner:
     # Max file size to read (500KB)
     MAX_FILE_SIZE = 500 * 1024
 
+    # Concurrent file reads per scan
+    READ_WORKERS = 16
+
+    # Extension -> language name
+    _LANG_MAP = {
+        '.py': 'Python', '.js': 'JavaScript', '.ts': 'TypeScript',
+        '.tsx': 'TypeScript/React', '.jsx': 'JavaScript/React',
+        '.java': 'Java', '.cpp': 'C++', '.c': 'C', '.h': 'C/C++ Header',
+        '.cs': 'C#', '.go': 'Go', '.rs': 'Rust', '.rb': 'Ruby',
+        '.php': 'PHP', '.swift': 'Swift', '.kt': 'Kotlin',
+        '.scala': 'Scala', '.r': 'R', '.R': 'R', '.sql': 'SQL',
+        '.sh': 'Shell', '.bash': 'Bash', '.ps1': 'PowerShell',
+        '.md': 'Markdown', '.json': 'JSON', '.yaml': 'YAML',
+        '.yml': 'YAML', '.xml': 'XML', '.toml': 'TOML'
+    }
+
     def __init__(self, include_code: bool = True, include_docs: bool = True,
-                 include_config: bool = True):
+                 include_config: bool = True, read_content: bool = True):
+        """
+        Initialize the folder scanner.
+
+        Args:
+            include_code/include_docs/include_config: File groups to scan
+            read_content: Read file contents up front; when False only paths,
+                sizes and languages are collected and each file is read on
+                SourceFile.load_content() (or preview())
+        """
+        self.read_content = read_content
         self.extensions = set()
         if include_code:
             self.extensions.update(self.CODE_EXTENSIONS)
@@ -80,6 +210,7 @@ class LocalFolderScanner:
             self.extensions.update(self.DOC_EXTENSIONS)
         if include_config:
             self.extensions.update(self.CONFIG_EXTENSIONS)
+        self._ext_tuple = tuple(ext.lower() for ext in self.extensions)
 
     def scan_folder(self, folder_path: str, max_files: int = 100) -> SourceContext:
         """Scan a local folder and return context"""
@@ -88,52 +219,89 @@ class LocalFolderScanner:
         if not os.path.exists(folder_path):
             raise ValueError(f"Folder does not exist: {folder_path}")
 
-        files = []
+        candidates = []
         structure = {"folders": [], "files": []}
-        total_size = 0
-
-        for root, dirs, filenames in os.walk(folder_path):
-            # Skip excluded directories
-            dirs[:] = [d for d in dirs if d not in self.SKIP_FOLDERS]
 
-            rel_root = os.path.relpath(root, folder_path)
-            if rel_root != '.':
+        # First pass: depth-first walk with os.scandir; DirEntry caches the file type
+        # and stat results so no extra syscalls are needed per file
+        stack = [(folder_path, '')]
+        while stack:
+            root, rel_root = stack.pop()
+            if rel_root:
                 structure["folders"].append(rel_root)
 
-            for filename in filenames:
-                if len(files) >= max_files:
-                    break
-
-                ext = os.path.splitext(filename)[1].lower()
-                if ext not in self.extensions:
-                    continue
+            try:
+                with os.scandir(root) as it:
+                    entries = list(it)
+            except OSError:
+                continue
 
-                filepath = os.path.join(root, filename)
-                rel_path = os.path.relpath(filepath, folder_path)
+            subdirs = []
+            for entry in entries:
+                name = entry.name
+                rel_path = f"{rel_root}{os.sep}{name}" if rel_root else name
 
                 try:
-                    size = os.path.getsize(filepath)
-                    if size > self.MAX_FILE_SIZE:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Skip excluded directories
+                        if name not in self.SKIP_FOLDERS:
+                            subdirs.append((entry.path, rel_path))
+                        continue
+                    if len(candidates) >= max_files:
                         continue
 
-                    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
+                    # Cheap suffix test before any stat or splitext work
+                    lower_name = name.lower()
+                    if not lower_name.endswith(self._ext_tuple):
+                        continue
+                    ext = os.path.splitext(lower_name)[1]
+                    if ext not in self.extensions or not entry.is_file():
+                        continue
 
-                    files.append(SourceFile(
-                        path=rel_path,
-                        name=filename,
-                        content=content,
-                        source_type="local",
-                        size=size,
-                        language=self._detect_language(ext)
-                    ))
+                    size = entry.stat().st_size
+                    if size > self.MAX_FILE_SIZE:
+                        continue
 
-                    structure["files"].append(rel_path)
-                    total_size += size
+                    candidates.append((entry.path, rel_path, name, size, ext))
 
-                except Exception as e:
+                except OSError:
+                    # Entry vanished or cannot be stat'ed
                     continue
 
+            # Push in reverse so subfolders are visited in listing order
+            stack.extend(reversed(subdirs))
+
+        # Second pass: read contents concurrently; open() and read() release
+        # the GIL so page-cache misses overlap instead of queueing
+        if self.read_content and len(candidates) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.READ_WORKERS, len(candidates))) as pool:
+                contents = list(pool.map(self._read_file, [c[0] for c in candidates]))
+        elif self.read_content:
+            contents = [self._read_file(c[0]) for c in candidates]
+        else:
+            contents = [None] * len(candidates)
+
+        files = []
+        total_size = 0
+        for (filepath, rel_path, name, size, ext), content in zip(candidates, contents):
+            if content is None and self.read_content:
+                continue
+
+            loader = None if self.read_content else partial(self._read_file, filepath)
+            files.append(SourceFile(
+                path=rel_path,
+                name=name,
+                content=content,
+                source_type="local",
+                size=size,
+                language=self._detect_language(ext),
+                content_loader=loader,
+                preview_loader=loader
+            ))
+
+            structure["files"].append(rel_path)
+            total_size += size
+
         summary = self._generate_summary(folder_path, files, structure)
 
         return SourceContext(
@@ -146,37 +314,33 @@ class LocalFolderScanner:
             structure=structure
         )
 
+    def _read_file(self, filepath: str, size: int = -1) -> Optional[str]:
+        """Read a file (or its first size characters) as text, None if it cannot be opened"""
+        try:
+            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+                return f.read(size)
+        except Exception:
+            return None
+
     def _detect_language(self, ext: str) -> str:
         """Detect programming language from extension"""
-        lang_map = {
-            '.py': 'Python', '.js': 'JavaScript', '.ts': 'TypeScript',
-            '.tsx': 'TypeScript/React', '.jsx': 'JavaScript/React',
-            '.java': 'Java', '.cpp': 'C++', '.c': 'C', '.h': 'C/C++ Header',
-            '.cs': 'C#', '.go': 'Go', '.rs': 'Rust', '.rb': 'Ruby',
-            '.php': 'PHP', '.swift': 'Swift', '.kt': 'Kotlin',
-            '.scala': 'Scala', '.r': 'R', '.R': 'R', '.sql': 'SQL',
-            '.sh': 'Shell', '.bash': 'Bash', '.ps1': 'PowerShell',
-            '.md': 'Markdown', '.json': 'JSON', '.yaml': 'YAML',
-            '.yml': 'YAML', '.xml': 'XML', '.toml': 'TOML'
-        }
-        return lang_map.get(ext, 'Unknown')
+        return self._LANG_MAP.get(ext, 'Unknown')
 
     def _generate_summary(self, folder_path: str, files: List[SourceFile],
                           structure: Dict) -> str:
         """Generate a summary of the folder contents"""
-        lang_counts = {}
-        for f in files:
-            lang = f.language or 'Unknown'
-            lang_counts[lang] = lang_counts.get(lang, 0) + 1
+        lang_counts = Counter(f.language or 'Unknown' for f in files)
 
-        summary = f"Local folder: {folder_path}\n"
-        summary += f"Total files scanned: {len(files)}\n"
-        summary += f"Total folders: {len(structure['folders'])}\n\n"
-        summary += "Languages found:\n"
-        for lang, count in sorted(lang_counts.items(), key=lambda x: -x[1]):
-            summary += f"  - {lang}: {count} files\n"
+        parts = [
+            f"Local folder: {folder_path}\n",
+            f"Total files scanned: {len(files)}\n",
+            f"Total folders: {len(structure['folders'])}\n\n",
+            "Languages found:\n",
+        ]
+        for lang, count in lang_counts.most_common():
+            parts.append(f"  - {lang}: {count} files\n")
 
-        return summary
+        return "".join(parts)
 
 
 # =============================================================================
@@ -187,6 +351,12 @@ class GitHubIntegration:
     """Fetch and analyze GitHub repositories"""
 
     API_BASE = "https://api.github.com"
+    RAW_BASE = "https://raw.githubusercontent.com"
+
+    # owner/repo from https://, ssh:// and git@ URLs (extra path, query,
+    # fragment and .git suffix ignored), or from a bare "owner/repo"
+    _REPO_URL_RE = re.compile(r'github\.com[:/]+([\w.-]+)/([\w.-]+?)(?:\.git)?(?:[/?#]|$)')
+    _REPO_RE = re.compile(r'([\w.-]+)/([\w.-]+?)(?:\.git)?/?$')
 
     # File extensions to fetch
     FETCH_EXTENSIONS = {
@@ -194,14 +364,88 @@ class GitHubIntegration:
         '.cs', '.go', '.rs', '.rb', '.php', '.swift', '.kt', '.md', '.txt',
         '.json', '.yaml', '.yml', '.toml'
     }
+    _EXT_NODOT = frozenset(ext[1:] for ext in FETCH_EXTENSIONS)
 
     MAX_FILE_SIZE = 500 * 1024  # 500KB
 
-    def __init__(self, github_token: Optional[str] = None):
+    # File downloads are streamed in chunks and abandoned past MAX_FILE_SIZE
+    STREAM_CHUNK_SIZE = 64 * 1024
+
+    # Concurrent file-content downloads per fetch_repo call
+    FETCH_CONCURRENCY = 16
+
+    # Files requested per GraphQL query (aliased object lookups)
+    GRAPHQL_BATCH = 100
+
+    # Pooled keep-alive connections and per-request timeout (seconds)
+    POOL_SIZE = 32
+    REQUEST_TIMEOUT = 10
+
+    # Requests pause until X-RateLimit-Reset once fewer than RATE_LIMIT_RESERVE
+    # calls remain, unless the reset is more than RATE_LIMIT_MAX_WAIT seconds away
+    RATE_LIMIT_RESERVE = FETCH_CONCURRENCY
+    RATE_LIMIT_MAX_WAIT = 60
+
+    # API URL (repo info, tree) -> (ETag, parsed body), shared by all instances
+    # so repeat fetches revalidate with If-None-Match; 304 replies skip the
+    # rate limit. File bodies are left to the blob cache below.
+    ETAG_CACHE_SIZE = 64
+    _etag_cache: "OrderedDict[str, Tuple[str, object]]" = OrderedDict()
+    _etag_lock = threading.Lock()
+
+    # Blob sha -> file text. Blobs are immutable, so cached text never goes
+    # stale; recent blobs stay in memory, and on disk only when a
+    # blob_cache_dir is passed in
+    BLOB_MEMORY_SIZE = 256
+    _blob_memory: "OrderedDict[str, str]" = OrderedDict()
+    _blob_lock = threading.Lock()
+
+    # Extension -> language name
+    _LANG_MAP = {
+        '.py': 'Python', '.js': 'JavaScript', '.ts': 'TypeScript',
+        '.tsx': 'TypeScript/React', '.jsx': 'JavaScript/React',
+        '.java': 'Java', '.cpp': 'C++', '.c': 'C', '.h': 'C/C++ Header',
+        '.cs': 'C#', '.go': 'Go', '.rs': 'Rust', '.rb': 'Ruby',
+        '.php': 'PHP', '.swift': 'Swift', '.kt': 'Kotlin',
+        '.md': 'Markdown', '.json': 'JSON', '.yaml': 'YAML',
+        '.yml': 'YAML', '.toml': 'TOML'
+    }
+
+    def __init__(self, github_token: Optional[str] = None, lazy_content: bool = False,
+                 blob_cache_dir: Optional[str] = None):
+        """
+        Initialize the GitHub client.
+
+        Args:
+            github_token: Personal access token (enables GraphQL batching)
+            lazy_content: Defer downloads until SourceFile.load_content() is called;
+                preview(n) then fetches only a byte range of the file
+            blob_cache_dir: Also keep fetched file contents in this directory
+                across runs. Off by default, since it writes repository
+                contents (private ones included) to disk with no expiry.
+        """
         self.token = github_token
+        self.lazy_content = lazy_content
+        self.blob_cache_dir = os.path.expanduser(blob_cache_dir) if blob_cache_dir else None
         self.headers = {"Accept": "application/vnd.github.v3+json"}
         if self.token:
             self.headers["Authorization"] = f"token {self.token}"
+        self._inflight = _InflightCalls()
+        self._rate_remaining: Optional[int] = None
+        self._rate_reset = 0.0
+
+        # One pooled session so TCP/TLS connections are reused across calls;
+        # transient 5xx and 429 replies are retried with backoff
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_SIZE,
+            pool_maxsize=self.POOL_SIZE,
+            max_retries=Retry(total=3, backoff_factor=0.5,
+                              status_forcelist=[429, 502, 503, 504])
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     def fetch_repo(self, repo_url: str, max_files: int = 100,
                    branch: str = "main") -> SourceContext:
@@ -216,6 +460,13 @@ class GitHubIntegration:
         # Parse repo URL
         owner, repo = self._parse_repo_url(repo_url)
 
+        # Concurrent fetches of the same repo share one set of requests
+        return self._inflight.run((owner, repo, branch, max_files), self._fetch_repo,
+                                  repo_url, owner, repo, max_files, branch)
+
+    def _fetch_repo(self, repo_url: str, owner: str, repo: str, max_files: int,
+                    branch: str) -> SourceContext:
+        """Fetch a parsed GitHub repository (see fetch_repo)"""
         # Get repo info
         repo_info = self._get_repo_info(owner, repo)
         default_branch = repo_info.get('default_branch', branch)
@@ -223,51 +474,45 @@ class GitHubIntegration:
         # Get file tree
         tree = self._get_tree(owner, repo, default_branch)
 
-        # Fetch relevant files
-        files = []
+        # Select relevant files; islice stops walking the tree as soon as
+        # enough candidates are found
         structure = {"folders": set(), "files": []}
-        total_size = 0
+        remaining = self._iter_candidates(tree.get('tree', ()), structure["folders"])
 
-        for item in tree.get('tree', []):
-            if len(files) >= max_files:
+        files = []
+        total_size = 0
+        while len(files) < max_files:
+            candidates = list(islice(remaining, max_files - len(files)))
+            if not candidates:
                 break
 
-            if item['type'] == 'tree':
-                structure["folders"].add(item['path'])
-                continue
-
-            if item['type'] != 'blob':
-                continue
-
-            # Check extension
-            ext = os.path.splitext(item['path'])[1].lower()
-            if ext not in self.FETCH_EXTENSIONS:
-                continue
-
-            # Check size
-            size = item.get('size', 0)
-            if size > self.MAX_FILE_SIZE:
-                continue
+            # Fetch contents concurrently; results come back in candidate
+            # order. Failed downloads are replaced from the rest of the tree.
+            if self.lazy_content:
+                contents = [None] * len(candidates)
+            else:
+                contents = self._fetch_contents(owner, repo, [c[0] for c in candidates],
+                                                default_branch, [c[3] for c in candidates])
 
-            # Fetch content
-            try:
-                content = self._get_file_content(owner, repo, item['path'], default_branch)
+            for (path, size, ext, sha), content in zip(candidates, contents):
+                if isinstance(content, BaseException):
+                    continue
 
+                file_args = (owner, repo, path, default_branch, sha)
                 files.append(SourceFile(
-                    path=item['path'],
-                    name=os.path.basename(item['path']),
+                    path=path,
+                    name=os.path.basename(path),
                     content=content,
                     source_type="github",
                     size=size,
-                    language=self._detect_language(ext)
+                    language=self._detect_language(ext),
+                    content_loader=partial(self._load_file, *file_args) if self.lazy_content else None,
+                    preview_loader=partial(self._load_preview, *file_args) if self.lazy_content else None
                 ))
 
-                structure["files"].append(item['path'])
+                structure["files"].append(path)
                 total_size += size
 
-            except Exception as e:
-                continue
-
         structure["folders"] = list(structure["folders"])
         summary = self._generate_summary(repo_url, repo_info, files, structure)
 
@@ -281,83 +526,365 @@ class GitHubIntegration:
             structure=structure
         )
 
-    def _parse_repo_url(self, url: str) -> Tuple[str, str]:
-        """Parse GitHub URL to get owner and repo"""
-        # Handle various URL formats
-        url = url.rstrip('/')
+    def _iter_candidates(self, items, folders: set):
+        """
+        Yield (path, size, ext, sha) for fetchable blobs in tree order,
+        adding tree entries seen along the way to folders.
+        """
+        for item in items:
+            if item['type'] == 'tree':
+                folders.add(item['path'])
+                continue
+
+            if item['type'] != 'blob':
+                continue
 
-        if 'github.com' in url:
-            parts = url.split('github.com/')[-1].split('/')
-            if len(parts) >= 2:
-                return parts[0], parts[1].replace('.git', '')
+            # Check extension; like splitext, leading dots of the file name
+            # (".md") do not start an extension
+            head, _, ext = item['path'].rpartition('.')
+            ext = ext.lower()
+            if ext not in self._EXT_NODOT or not head.rpartition('/')[2].strip('.'):
+                continue
+
+            # Check size
+            size = item.get('size', 0)
+            if size > self.MAX_FILE_SIZE:
+                continue
 
-        # Assume format owner/repo
-        parts = url.split('/')
-        if len(parts) >= 2:
-            return parts[-2], parts[-1].replace('.git', '')
+            yield item['path'], size, '.' + ext, item.get('sha')
+
+    def _parse_repo_url(self, url: str) -> Tuple[str, str]:
+        """Parse GitHub URL to get owner and repo"""
+        match = self._REPO_URL_RE.search(url) or self._REPO_RE.search(url)
+        if match:
+            return match.group(1), match.group(2)
 
         raise ValueError(f"Could not parse GitHub URL: {url}")
 
     def _get_repo_info(self, owner: str, repo: str) -> Dict:
         """Get repository information"""
         url = f"{self.API_BASE}/repos/{owner}/{repo}"
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
+        return self._conditional_get(url, lambda response: response.json())
 
     def _get_tree(self, owner: str, repo: str, branch: str) -> Dict:
         """Get repository file tree"""
         url = f"{self.API_BASE}/repos/{owner}/{repo}/git/trees/{branch}?recursive=1"
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
+        return self._conditional_get(url, lambda response: response.json())
 
     def _get_file_content(self, owner: str, repo: str, path: str, branch: str) -> str:
         """Get file content from repository"""
-        url = f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{path}"
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.text
+        url = f"{self.RAW_BASE}/{owner}/{repo}/{branch}/{path}"
+        return self._inflight.run(url, self._get_raw, url)
+
+    def _load_file(self, owner: str, repo: str, path: str, branch: str,
+                   sha: Optional[str]) -> str:
+        """Fetch one file for a lazily loaded SourceFile"""
+        content = self._fetch_contents(owner, repo, [path], branch, [sha])[0]
+        if isinstance(content, BaseException):
+            raise content
+        return content
+
+    def _load_preview(self, owner: str, repo: str, path: str, branch: str,
+                      sha: Optional[str], n: int) -> str:
+        """First n characters of a file, downloading only a byte range"""
+        text = self._get_blob_by_sha(sha) if sha else None
+        if text is not None:
+            return text[:n]
+
+        # UTF-8 needs at most 4 bytes per character
+        limit = 4 * n
+        url = f"{self.RAW_BASE}/{owner}/{repo}/{branch}/{path}"
+        buf = bytearray()
+        # Ranges of a compressed body are not decodable prefixes on every
+        # server, so previews request the identity encoding
+        with self.session.get(url, headers={"Range": f"bytes=0-{limit - 1}",
+                                            "Accept-Encoding": "identity"},
+                              stream=True, timeout=self.REQUEST_TIMEOUT) as response:
+            response.raise_for_status()
+            # Servers that ignore Range send the whole file; stop reading early
+            for chunk in response.iter_content(self.STREAM_CHUNK_SIZE):
+                buf += chunk
+                if len(buf) >= limit:
+                    break
+        return buf[:limit].decode('utf-8', errors='replace')[:n]
+
+    def _read_limited(self, response: requests.Response) -> str:
+        """Read a streamed body as UTF-8, aborting once it exceeds MAX_FILE_SIZE"""
+        buf = bytearray()
+        for chunk in response.iter_content(self.STREAM_CHUNK_SIZE):
+            buf += chunk
+            if len(buf) > self.MAX_FILE_SIZE:
+                raise ValueError(f"File exceeds {self.MAX_FILE_SIZE} bytes: {response.url}")
+        return buf.decode('utf-8', errors='replace')
+
+    def _get_raw(self, url: str) -> str:
+        """Download one raw file"""
+        time.sleep(self._rate_limit_delay())
+        with self.session.get(url, stream=True, timeout=self.REQUEST_TIMEOUT) as response:
+            self._note_rate_limit(response.headers)
+            response.raise_for_status()
+            return self._read_limited(response)
+
+    def _conditional_get(self, url: str, parse):
+        """GET url, revalidating a cached body with If-None-Match"""
+        headers, cached = self._etag_headers(url)
+        time.sleep(self._rate_limit_delay())
+        with self.session.get(url, headers=headers,
+                              timeout=self.REQUEST_TIMEOUT) as response:
+            self._note_rate_limit(response.headers)
+            if response.status_code == 304 and cached:
+                return cached[1]
+            response.raise_for_status()
+            body = parse(response)
+        self._store_etag(url, response.headers.get('ETag'), body)
+        return body
+
+    def _note_rate_limit(self, headers) -> None:
+        """Record the rate-limit budget reported by a response, if any"""
+        remaining = headers.get('X-RateLimit-Remaining')
+        if remaining is None:
+            return
+        try:
+            self._rate_remaining = int(remaining)
+            self._rate_reset = float(headers.get('X-RateLimit-Reset', 0))
+        except ValueError:
+            pass
+
+    def _rate_limit_delay(self) -> float:
+        """Seconds to wait before the next request to stay within the rate limit"""
+        if self._rate_remaining is None or self._rate_remaining >= self.RATE_LIMIT_RESERVE:
+            return 0.0
+        delay = self._rate_reset - time.time()
+        if delay <= 0:
+            # Window has reset; the next response reports the new budget
+            self._rate_remaining = None
+            return 0.0
+        return delay if delay <= self.RATE_LIMIT_MAX_WAIT else 0.0
+
+    def _etag_headers(self, url: str) -> Tuple[Dict, Optional[Tuple[str, object]]]:
+        """Request headers for url plus its cached (ETag, body), if any"""
+        with self._etag_lock:
+            cached = self._etag_cache.get(url)
+            if cached is None:
+                return self.headers, None
+            self._etag_cache.move_to_end(url)
+        return {**self.headers, "If-None-Match": cached[0]}, cached
+
+    def _store_etag(self, url: str, etag: Optional[str], body) -> None:
+        """Remember a response body under its ETag, evicting the oldest entries"""
+        if not etag:
+            return
+        with self._etag_lock:
+            self._etag_cache[url] = (etag, body)
+            self._etag_cache.move_to_end(url)
+            while len(self._etag_cache) > self.ETAG_CACHE_SIZE:
+                self._etag_cache.popitem(last=False)
+
+    def _fetch_contents(self, owner: str, repo: str, paths: List[str],
+                        branch: str, shas: Optional[List[str]] = None) -> List:
+        """
+        Fetch many files, from the blob cache when their sha is known and
+        otherwise batched through GraphQL when authenticated.
+
+        Returns one entry per path, in order: the file text, or the exception
+        raised while fetching it.
+        """
+        sha_by_path = dict(zip(paths, shas or ()))
+        results = {}
+        for path, sha in sha_by_path.items():
+            text = self._get_blob_by_sha(sha) if sha else None
+            if text is not None:
+                results[path] = text
+
+        missing = [path for path in paths if path not in results]
+        if self.token and missing:
+            # GraphQL requires a token; it returns many blobs per request
+            results.update(self._graphql_contents(owner, repo, missing, branch))
+
+        # Binary, oversized or failed lookups go through raw downloads
+        remaining = [path for path in missing if path not in results]
+        results.update(zip(remaining, self._fetch_raw_contents(owner, repo, remaining, branch)))
+
+        for path in missing:
+            sha = sha_by_path.get(path)
+            if sha and isinstance(results[path], str):
+                self._store_blob(sha, results[path])
+        return [results[path] for path in paths]
+
+    def _blob_path(self, sha: str) -> Optional[str]:
+        """On-disk location of a cached blob"""
+        if not self.blob_cache_dir:
+            return None
+        return os.path.join(self.blob_cache_dir, sha[:2], sha)
+
+    def _get_blob_by_sha(self, sha: str) -> Optional[str]:
+        """Cached text of a blob, from memory or disk, or None on a miss"""
+        with self._blob_lock:
+            text = self._blob_memory.get(sha)
+            if text is not None:
+                self._blob_memory.move_to_end(sha)
+                return text
+
+        path = self._blob_path(sha)
+        try:
+            with open(path, 'rb') as f:
+                text = f.read().decode('utf-8')
+        except (TypeError, OSError, UnicodeDecodeError):
+            return None
+
+        self._remember_blob(sha, text)
+        return text
+
+    def _store_blob(self, sha: str, text: str) -> None:
+        """Cache a blob's text in memory and, if enabled, atomically on disk"""
+        self._remember_blob(sha, text)
+        path = self._blob_path(sha)
+        if path is None or os.path.exists(path):
+            return
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+            with os.fdopen(fd, 'wb') as f:
+                f.write(text.encode('utf-8'))
+            os.replace(tmp_path, path)
+        except OSError:
+            # The disk tier is best-effort
+            pass
+
+    def _remember_blob(self, sha: str, text: str) -> None:
+        """Keep a blob in the in-memory LRU"""
+        with self._blob_lock:
+            self._blob_memory[sha] = text
+            self._blob_memory.move_to_end(sha)
+            while len(self._blob_memory) > self.BLOB_MEMORY_SIZE:
+                self._blob_memory.popitem(last=False)
+
+    def _graphql_contents(self, owner: str, repo: str, paths: List[str],
+                          branch: str) -> Dict[str, str]:
+        """Get text of many files with one GraphQL query per GRAPHQL_BATCH paths"""
+        url = f"{self.API_BASE}/graphql"
+        contents = {}
+        for start in range(0, len(paths), self.GRAPHQL_BATCH):
+            batch = paths[start:start + self.GRAPHQL_BATCH]
+            fields = " ".join(
+                f"f{i}: object(expression: {json.dumps(f'{branch}:{path}')}) "
+                f"{{ ... on Blob {{ text isBinary }} }}"
+                for i, path in enumerate(batch)
+            )
+            query = ("query($owner: String!, $name: String!) { "
+                     f"repository(owner: $owner, name: $name) {{ {fields} }} }}")
+            try:
+                response = self.session.post(url, timeout=self.REQUEST_TIMEOUT, json={
+                    "query": query,
+                    "variables": {"owner": owner, "name": repo}
+                })
+                response.raise_for_status()
+                repository = (response.json().get("data") or {}).get("repository") or {}
+            except (requests.RequestException, ValueError):
+                continue
+
+            for i, path in enumerate(batch):
+                blob = repository.get(f"f{i}") or {}
+                text = blob.get("text")
+                if text is None or blob.get("isBinary"):
+                    continue
+                # Same cap as streamed downloads (tree sizes can understate)
+                if len(text) > self.MAX_FILE_SIZE:
+                    contents[path] = ValueError(f"File exceeds {self.MAX_FILE_SIZE} bytes: {path}")
+                else:
+                    contents[path] = text
+        return contents
+
+    def _fetch_raw_contents(self, owner: str, repo: str, paths: List[str],
+                            branch: str) -> List:
+        """Download many files from RAW_BASE concurrently, in path order"""
+        if aiohttp is not None and paths:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(self._afetch_contents(owner, repo, paths, branch))
+
+        # No aiohttp, or already inside an event loop: use worker threads
+        with ThreadPoolExecutor(max_workers=self.FETCH_CONCURRENCY) as pool:
+            futures = [pool.submit(self._get_file_content, owner, repo, path, branch)
+                       for path in paths]
+        return [f.exception() or f.result() for f in futures]
+
+    async def _afetch_contents(self, owner: str, repo: str, paths: List[str],
+                               branch: str) -> List:
+        """Fetch many files over one aiohttp session, FETCH_CONCURRENCY at a time"""
+        semaphore = asyncio.Semaphore(self.FETCH_CONCURRENCY)
+        async with aiohttp.ClientSession(
+            headers=self.headers,
+            connector=aiohttp.TCPConnector(limit=self.POOL_SIZE),
+            timeout=aiohttp.ClientTimeout(total=self.REQUEST_TIMEOUT)
+        ) as session:
+            tasks = [self._afetch_file_content(session, semaphore, owner, repo, path, branch)
+                     for path in paths]
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _afetch_file_content(self, session, semaphore: asyncio.Semaphore,
+                                   owner: str, repo: str, path: str, branch: str) -> str:
+        """Get file content from repository (async)"""
+        url = f"{self.RAW_BASE}/{owner}/{repo}/{branch}/{path}"
+        delay = self._rate_limit_delay()
+        if delay:
+            await asyncio.sleep(delay)
+        async with semaphore:
+            async with session.get(url) as response:
+                self._note_rate_limit(response.headers)
+                response.raise_for_status()
+                buf = bytearray()
+                async for chunk in response.content.iter_chunked(self.STREAM_CHUNK_SIZE):
+                    buf += chunk
+                    if len(buf) > self.MAX_FILE_SIZE:
+                        raise ValueError(f"File exceeds {self.MAX_FILE_SIZE} bytes: {url}")
+                return buf.decode('utf-8', errors='replace')
 
     def _detect_language(self, ext: str) -> str:
         """Detect programming language from extension"""
-        lang_map = {
-            '.py': 'Python', '.js': 'JavaScript', '.ts': 'TypeScript',
-            '.tsx': 'TypeScript/React', '.jsx': 'JavaScript/React',
-            '.java': 'Java', '.cpp': 'C++', '.c': 'C', '.h': 'C/C++ Header',
-            '.cs': 'C#', '.go': 'Go', '.rs': 'Rust', '.rb': 'Ruby',
-            '.php': 'PHP', '.swift': 'Swift', '.kt': 'Kotlin',
-            '.md': 'Markdown', '.json': 'JSON', '.yaml': 'YAML',
-            '.yml': 'YAML', '.toml': 'TOML'
-        }
-        return lang_map.get(ext, 'Unknown')
+        return self._LANG_MAP.get(ext, 'Unknown')
 
     def _generate_summary(self, repo_url: str, repo_info: Dict,
                           files: List[SourceFile], structure: Dict) -> str:
         """Generate summary of repository"""
-        lang_counts = {}
-        for f in files:
-            lang = f.language or 'Unknown'
-            lang_counts[lang] = lang_counts.get(lang, 0) + 1
-
-        summary = f"GitHub Repository: {repo_url}\n"
-        summary += f"Description: {repo_info.get('description', 'N/A')}\n"
-        summary += f"Stars: {repo_info.get('stargazers_count', 0)}\n"
-        summary += f"Language: {repo_info.get('language', 'N/A')}\n"
-        summary += f"Total files fetched: {len(files)}\n\n"
-        summary += "File types found:\n"
-        for lang, count in sorted(lang_counts.items(), key=lambda x: -x[1]):
-            summary += f"  - {lang}: {count} files\n"
-
-        return summary
-
-    def clone_repo(self, repo_url: str, target_dir: Optional[str] = None) -> str:
-        """Clone repository to local directory"""
+        lang_counts = Counter(f.language or 'Unknown' for f in files)
+
+        parts = [
+            f"GitHub Repository: {repo_url}\n",
+            f"Description: {repo_info.get('description', 'N/A')}\n",
+            f"Stars: {repo_info.get('stargazers_count', 0)}\n",
+            f"Language: {repo_info.get('language', 'N/A')}\n",
+            f"Total files fetched: {len(files)}\n\n",
+            "File types found:\n",
+        ]
+        for lang, count in lang_counts.most_common():
+            parts.append(f"  - {lang}: {count} files\n")
+
+        return "".join(parts)
+
+    def clone_repo(self, repo_url: str, target_dir: Optional[str] = None,
+                   tree_only: bool = False) -> str:
+        """
+        Clone repository to local directory.
+
+        Uses a shallow, single-branch partial clone so blobs are only
+        downloaded for the checkout. With tree_only, no checkout is made and
+        only commit objects are fetched (trees load on demand).
+        """
         if target_dir is None:
             target_dir = tempfile.mkdtemp()
 
-        subprocess.run(['git', 'clone', '--depth', '1', repo_url, target_dir],
-                      check=True, capture_output=True)
+        args = ['git', 'clone', '--depth', '1', '--single-branch']
+        if tree_only:
+            args += ['--filter=tree:0', '--no-checkout']
+        else:
+            args.append('--filter=blob:none')
+
+        # Fail fast on credential prompts instead of hanging
+        subprocess.run(args + [repo_url, target_dir],
+                      check=True, capture_output=True,
+                      env={**os.environ, 'GIT_TERMINAL_PROMPT': '0'})
         return target_dir
 
 
@@ -373,6 +900,12 @@ class GoogleDriveIntegration:
 
     SCOPES = ['https://www.googleapis.com/auth/drive.readonly']
 
+    # Folder ID from ".../folders/<id>" or "...?id=<id>" URLs
+    _FOLDER_ID_RE = re.compile(r'(?:folders/|id=)([A-Za-z0-9_-]{10,})')
+
+    # Concurrent file downloads per fetch_folder call
+    DOWNLOAD_WORKERS = 16
+
     # Supported MIME types
     SUPPORTED_MIMES = {
         'application/pdf': '.pdf',
@@ -397,6 +930,9 @@ class GoogleDriveIntegration:
         self.credentials_path = credentials_path
         self.api_key = api_key
         self.service = None
+        self._credentials = None
+        self._thread_local = threading.local()
+        self._inflight = _InflightCalls()
 
         if credentials_path and os.path.exists(credentials_path):
             self._init_service()
@@ -411,6 +947,7 @@ class GoogleDriveIntegration:
                 self.credentials_path, scopes=self.SCOPES
             )
             self.service = build('drive', 'v3', credentials=credentials)
+            self._credentials = credentials
         except ImportError:
             raise ImportError(
                 "Google Drive integration requires: "
@@ -439,9 +976,14 @@ class GoogleDriveIntegration:
                 structure={"folders": [], "files": []}
             )
 
-        files = []
+        # Concurrent fetches of the same folder share one set of requests
+        return self._inflight.run((folder_id, max_files), self._fetch_folder,
+                                  folder_id, max_files)
+
+    def _fetch_folder(self, folder_id: str, max_files: int) -> SourceContext:
+        """Fetch a Google Drive folder through the configured service"""
+        candidates = []
         structure = {"folders": [], "files": []}
-        total_size = 0
 
         # List files in folder
         results = self.service.files().list(
@@ -453,7 +995,7 @@ class GoogleDriveIntegration:
         items = results.get('files', [])
 
         for item in items:
-            if len(files) >= max_files:
+            if len(candidates) >= max_files:
                 break
 
             mime_type = item.get('mimeType', '')
@@ -467,25 +1009,33 @@ class GoogleDriveIntegration:
             if mime_type not in self.SUPPORTED_MIMES:
                 continue
 
-            try:
-                content = self._get_file_content(item['id'], mime_type)
-                size = int(item.get('size', len(content)))
-
-                files.append(SourceFile(
-                    path=item['name'],
-                    name=item['name'],
-                    content=content,
-                    source_type="gdrive",
-                    size=size,
-                    language=self._detect_type(mime_type)
-                ))
+            candidates.append(item)
 
-                structure["files"].append(item['name'])
-                total_size += size
+        # Download bodies concurrently; list() already returned the metadata,
+        # and Drive batch requests cannot carry media downloads
+        with ThreadPoolExecutor(max_workers=self.DOWNLOAD_WORKERS) as pool:
+            futures = [pool.submit(self._download_item, item) for item in candidates]
 
-            except Exception as e:
+        files = []
+        total_size = 0
+        for item, future in zip(candidates, futures):
+            if future.exception() is not None:
                 continue
 
+            content = future.result()
+            size = int(item.get('size', len(content)))
+            files.append(SourceFile(
+                path=item['name'],
+                name=item['name'],
+                content=content,
+                source_type="gdrive",
+                size=size,
+                language=self._detect_type(item['mimeType'])
+            ))
+
+            structure["files"].append(item['name'])
+            total_size += size
+
         summary = self._generate_summary(folder_id, files, structure)
 
         return SourceContext(
@@ -498,7 +1048,22 @@ class GoogleDriveIntegration:
             structure=structure
         )
 
-    def _get_file_content(self, file_id: str, mime_type: str) -> str:
+    def _download_item(self, item: Dict) -> str:
+        """Download one listed file on a worker thread"""
+        return self._get_file_content(item['id'], item['mimeType'], http=self._thread_http())
+
+    def _thread_http(self):
+        """Authorized transport for the calling thread (httplib2 is not thread-safe)"""
+        http = getattr(self._thread_local, 'http', None)
+        if http is None and self._credentials is not None:
+            import google_auth_httplib2
+            import httplib2
+
+            http = google_auth_httplib2.AuthorizedHttp(self._credentials, http=httplib2.Http())
+            self._thread_local.http = http
+        return http
+
+    def _get_file_content(self, file_id: str, mime_type: str, http=None) -> str:
         """Get file content from Google Drive"""
         if mime_type.startswith('application/vnd.google-apps'):
             # Export Google Docs/Sheets as text
@@ -508,11 +1073,11 @@ class GoogleDriveIntegration:
 
             content = self.service.files().export(
                 fileId=file_id, mimeType=export_mime
-            ).execute()
+            ).execute(http=http)
             return content.decode('utf-8')
         else:
             # Download regular files
-            content = self.service.files().get_media(fileId=file_id).execute()
+            content = self.service.files().get_media(fileId=file_id).execute(http=http)
             return content.decode('utf-8', errors='ignore')
 
     def _detect_type(self, mime_type: str) -> str:
@@ -531,28 +1096,25 @@ class GoogleDriveIntegration:
     def _generate_summary(self, folder_id: str, files: List[SourceFile],
                           structure: Dict) -> str:
         """Generate summary of Google Drive folder"""
-        type_counts = {}
-        for f in files:
-            ftype = f.language or 'Unknown'
-            type_counts[ftype] = type_counts.get(ftype, 0) + 1
+        type_counts = Counter(f.language or 'Unknown' for f in files)
 
-        summary = f"Google Drive Folder: {folder_id}\n"
-        summary += f"Total files fetched: {len(files)}\n"
-        summary += f"Subfolders found: {len(structure['folders'])}\n\n"
-        summary += "File types found:\n"
-        for ftype, count in sorted(type_counts.items(), key=lambda x: -x[1]):
-            summary += f"  - {ftype}: {count} files\n"
+        parts = [
+            f"Google Drive Folder: {folder_id}\n",
+            f"Total files fetched: {len(files)}\n",
+            f"Subfolders found: {len(structure['folders'])}\n\n",
+            "File types found:\n",
+        ]
+        for ftype, count in type_counts.most_common():
+            parts.append(f"  - {ftype}: {count} files\n")
 
-        return summary
+        return "".join(parts)
 
     @staticmethod
     def extract_folder_id(url: str) -> str:
         """Extract folder ID from Google Drive URL"""
-        # Handle various URL formats
-        if 'folders/' in url:
-            return url.split('folders/')[-1].split('?')[0].split('/')[0]
-        if 'id=' in url:
-            return url.split('id=')[-1].split('&')[0]
+        match = GoogleDriveIntegration._FOLDER_ID_RE.search(url)
+        if match:
+            return match.group(1)
         # Assume it's already the ID
         return url
 
@@ -564,6 +1126,9 @@ class GoogleDriveIntegration:
 class SourceManager:
     """Unified interface for all source types"""
 
+    # Sources loaded concurrently by get_combined_context
+    LOAD_WORKERS = 8
+
     def __init__(self, github_token: Optional[str] = None,
                  gdrive_credentials: Optional[str] = None):
         self.local_scanner = LocalFolderScanner()
@@ -617,45 +1182,53 @@ class SourceManager:
         Returns:
             Combined context string for AI processing
         """
-        contexts = []
-
-        for src in sources:
-            try:
-                ctx = self.load_source(
-                    src['source'],
-                    src.get('type', 'auto'),
-                    src.get('max_files', 50)
-                )
-                contexts.append(ctx)
-            except Exception as e:
-                contexts.append(SourceContext(
-                    source_name=src['source'],
-                    source_type="error",
-                    files=[],
-                    total_files=0,
-                    total_size=0,
-                    summary=f"Error loading source: {e}",
-                    structure={}
-                ))
+        # Sources are independent I/O, so load them concurrently; map()
+        # keeps the results in input order
+        if len(sources) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.LOAD_WORKERS, len(sources))) as pool:
+                contexts = list(pool.map(self._load_or_error, sources))
+        else:
+            contexts = [self._load_or_error(src) for src in sources]
 
-        # Build combined context string
-        combined = "# Source Context\n\n"
+        # Build combined context string; pieces are joined once at the end
+        parts = ["# Source Context\n\n"]
 
         for ctx in contexts:
-            combined += f"## {ctx.source_type.upper()}: {ctx.source_name}\n\n"
-            combined += f"{ctx.summary}\n\n"
+            parts.append(f"## {ctx.source_type.upper()}: {ctx.source_name}\n\n")
+            parts.append(f"{ctx.summary}\n\n")
 
             # Add key files content
-            combined += "### Key Files:\n\n"
+            parts.append("### Key Files:\n\n")
             for f in ctx.files[:20]:  # Limit to 20 files per source
-                combined += f"#### {f.path}\n"
-                combined += f"```{f.language.lower() if f.language else ''}\n"
-                # Truncate very long files
-                content = f.content[:10000] if len(f.content) > 10000 else f.content
-                combined += content
-                combined += "\n```\n\n"
+                # Truncate very long files; skip ones that failed to load
+                text = f.preview(10000)
+                if text is None:
+                    continue
+                parts.append(f"#### {f.path}\n")
+                parts.append(f"```{f.language.lower() if f.language else ''}\n")
+                parts.append(text)
+                parts.append("\n```\n\n")
 
-        return combined
+        return "".join(parts)
+
+    def _load_or_error(self, src: Dict) -> SourceContext:
+        """Load one source spec, returning an "error" context if it fails"""
+        try:
+            return self.load_source(
+                src['source'],
+                src.get('type', 'auto'),
+                src.get('max_files', 50)
+            )
+        except Exception as e:
+            return SourceContext(
+                source_name=src['source'],
+                source_type="error",
+                files=[],
+                total_files=0,
+                total_size=0,
+                summary=f"Error loading source: {e}",
+                structure={}
+            )
 
     def export_context_to_json(self, sources: List[Dict], output_path: str):
         """Export source context to JSON file"""
@@ -677,7 +1250,7 @@ class SourceManager:
                             'name': f.name,
                             'language': f.language,
                             'size': f.size,
-                            'content': f.content[:5000]  # Truncate for JSON
+                            'content': f.preview(5000) or ""  # Truncate for JSON
                         }
                         for f in ctx.files
                     ]
@@ -688,8 +1261,13 @@ class SourceManager:
                     'error': str(e)
                 })
 
-        with open(output_path, 'w') as f:
-            json.dump(contexts, f, indent=2)
+        if orjson is not None:
+            # Writes UTF-8 directly rather than \u-escaping non-ASCII text
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(contexts, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(output_path, 'w') as f:
+                json.dump(contexts, f, indent=2)
 
 
 # =============================================================================
@@ -14,11 +14,21 @@ Complete source-to-docx pipeline for provisional patent generation.
 """
 
 import os
+import re
 import sys
 import json
+import importlib
 from datetime import datetime
-from typing import Optional, Dict, List, Tuple
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Dict, List, Tuple
 from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional - the score report falls back to the stdlib encoder
+    orjson = None
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -27,15 +37,45 @@ try:
     from modules.source_integrations import SourceManager, SourceContext
     from modules.patent_drafter import PatentDrafter, ProvisionalPatent
     from modules.ai_providers import AIOrchestrator
-    from modules.docx_generator import DocxPatentGenerator, PatentDocument, PatentFigure, InventorInfo
-    from modules.rubric_scorer import RubricScorer, score_patent
+    from modules.ai_cache import AICache
 except ImportError:
     # Fallback for direct execution
     from source_integrations import SourceManager, SourceContext
     from patent_drafter import PatentDrafter, ProvisionalPatent
     from ai_providers import AIOrchestrator
-    from docx_generator import DocxPatentGenerator, PatentDocument, PatentFigure, InventorInfo
-    from rubric_scorer import RubricScorer, score_patent
+    from ai_cache import AICache
+
+if TYPE_CHECKING:
+    from modules.docx_generator import PatentFigure
+
+
+def _import_module(name: str):
+    """
+    Import a sibling module on first use.
+
+    docx_generator (python-docx) and rubric_scorer (pyahocorasick) are
+    only needed once a pipeline is created, so they load then rather than
+    with this module.
+    """
+    try:
+        return importlib.import_module(f"modules.{name}")
+    except ImportError:
+        # Fallback for direct execution
+        return importlib.import_module(name)
+
+
+# US, EP and WO publication numbers, fused so research text is scanned once
+_PATENT_NUMBER_RE = re.compile(r'US\s*\d{7,8}\s*[AB]\d?|EP\s*\d{7}|WO\s*\d{4}/\d{6}',
+                               re.IGNORECASE)
+
+# Numbered and bulleted list items; kept as two patterns because their
+# matches may overlap (e.g. "1. - item")
+_NUMBERED_POINT_RE = re.compile(r'\d+\.\s+([^\n]{10,100})')
+_BULLET_POINT_RE = re.compile(r'[-*]\s+([^\n]{10,100})')
+
+# Separators turned into spaces, and words dropped, when naming the invention
+_TITLE_TRANS = str.maketrans({"-": " ", "_": " "})
+_TITLE_NOISE_RE = re.compile(r'Tool|App|Application|Project|V1|V2')
 
 
 @dataclass
@@ -72,6 +112,28 @@ class UnifiedPatentPipeline:
         )
     """
 
+    # Threads used to write figure files in Phase 5
+    FIGURE_WRITERS = 5
+
+    # (figure number, title, brief description, reference numerals)
+    FIGURE_SPECS = (
+        (1, "System Architecture", "illustrates a system 100 according to various embodiments.",
+         {100: "System", 101: "Client Interface", 102: "Processing Engine",
+          103: "Data Store", 104: "Network Interface"}),
+        (2, "Hardware Block Diagram", "illustrates a computing device 200 suitable for implementing aspects of the invention.",
+         {200: "Computing Device", 201: "Processor", 202: "Memory",
+          203: "Storage", 204: "Network Interface", 205: "I/O Controller"}),
+        (3, "Method Flowchart", "is a flowchart illustrating a method 300 according to various embodiments.",
+         {300: "Method", 302: "Receive Input", 304: "Process Data",
+          306: "Generate Output", 308: "End"}),
+        (4, "Data Flow Diagram", "illustrates data flow 400 through the system according to various embodiments.",
+         {400: "Data Flow", 401: "Raw Input", 402: "Preprocessing",
+          403: "Core Processing", 404: "Output Generation"}),
+        (5, "Alternative Embodiment", "illustrates an alternative implementation 500 according to various embodiments.",
+         {500: "Alternative System", 501: "Distributed Nodes",
+          502: "Central Coordinator", 503: "Results Aggregation"})
+    )
+
     def __init__(
         self,
         claude_key: str = None,
@@ -79,7 +141,8 @@ class UnifiedPatentPipeline:
         perplexity_key: str = None,
         krea_key: str = None,
         github_token: str = None,
-        gdrive_credentials: str = None
+        gdrive_credentials: str = None,
+        use_cache: bool = False
     ):
         """
         Initialize the pipeline with API keys.
@@ -91,6 +154,8 @@ class UnifiedPatentPipeline:
             krea_key: Krea AI API key (diagrams)
             github_token: GitHub token for private repos
             gdrive_credentials: Google Drive credentials path
+            use_cache: Reuse cached AI responses for identical prompts; off by
+                default because the cache keeps prompts and responses on disk
         """
         # Store keys
         self.claude_key = claude_key
@@ -99,20 +164,24 @@ class UnifiedPatentPipeline:
         self.krea_key = krea_key
 
         # Initialize components
-        self.ai = AIOrchestrator(claude_key, openai_key, perplexity_key, krea_key)
+        self.ai = AIOrchestrator(claude_key, openai_key, perplexity_key, krea_key,
+                                 cache=AICache() if use_cache else None)
         self.source_manager = SourceManager()
         self.drafter = PatentDrafter(self.ai)
-        self.docx_generator = DocxPatentGenerator()
-        self.scorer = RubricScorer()
+        self.docx_generator = _import_module("docx_generator").DocxPatentGenerator()
+        self.scorer = _import_module("rubric_scorer").RubricScorer()
 
         # State tracking
         self.source_context: Optional[SourceContext] = None
         self.innovations: List[Dict] = []
         self.prior_art: Dict = {}
         self.patent: Optional[ProvisionalPatent] = None
-        self.figures: List[PatentFigure] = []
+        self.figures: List["PatentFigure"] = []
         self.score_result = None
 
+        # (source context, text) memoized by _build_context_text
+        self._context_text: Optional[Tuple[SourceContext, str]] = None
+
         # Phase callbacks for progress reporting
         self.phase_callback = None
 
@@ -159,8 +228,15 @@ class UnifiedPatentPipeline:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
         if output_dir is None:
-            output_dir = os.path.join(os.getcwd(), f"patent_output_{timestamp}")
-        os.makedirs(output_dir, exist_ok=True)
+            output_path = Path.cwd() / f"patent_output_{timestamp}"
+        else:
+            output_path = Path(output_dir)
+        output_dir = str(output_path)
+
+        # One call creates the output directory along with its figures directory
+        figures_path = output_path / "patent_figures"
+        figures_path.mkdir(parents=True, exist_ok=True)
+        figures_dir = str(figures_path)
 
         try:
             # =====================================================
@@ -224,18 +300,13 @@ class UnifiedPatentPipeline:
             self._report_phase(5, "Generating patent figures (Krea AI + Playwright)...")
 
             self.figures = self._generate_figures(title, invention_desc)
-            figures_dir = os.path.join(output_dir, "patent_figures")
-            os.makedirs(figures_dir, exist_ok=True)
-
-            # Save figures
-            for fig in self.figures:
-                if fig.image_data:
-                    fig_path = os.path.join(
-                        figures_dir,
-                        f"FIG_{fig.figure_number}_{fig.title.replace(' ', '_')}.{fig.image_format}"
-                    )
-                    with open(fig_path, 'wb') as f:
-                        f.write(fig.image_data)
+
+            # Save figures concurrently; write() releases the GIL, so large
+            # images overlap on disk
+            pending = [fig for fig in self.figures if fig.image_data and not fig.image_path]
+            if pending:
+                with ThreadPoolExecutor(max_workers=min(self.FIGURE_WRITERS, len(pending))) as pool:
+                    list(pool.map(lambda fig: self._save_figure(fig, figures_dir), pending))
 
             print(f"  Generated {len(self.figures)} figures")
 
@@ -244,7 +315,8 @@ class UnifiedPatentPipeline:
             # =====================================================
             self._report_phase(6, "Creating .docx document...")
 
-            inventor = InventorInfo(
+            docx_types = _import_module("docx_generator")
+            inventor = docx_types.InventorInfo(
                 name=inventor_name,
                 address=inventor_address,
                 city=inventor_city,
@@ -254,7 +326,7 @@ class UnifiedPatentPipeline:
                 entity_type=entity_type
             )
 
-            patent_doc = PatentDocument(
+            patent_doc = docx_types.PatentDocument(
                 title=self.patent.title,
                 inventor=inventor,
                 field_of_invention=self.patent.field,
@@ -268,28 +340,38 @@ class UnifiedPatentPipeline:
                 assignee=assignee
             )
 
-            docx_path = os.path.join(output_dir, f"provisional_patent_{timestamp}.docx")
-            self.docx_generator.generate(patent_doc, docx_path)
-            print(f"  Created: {docx_path}")
+            # Build and save the docx in the background; Phase 7 only reads
+            # patent_doc, so scoring overlaps it
+            docx_path = str(output_path / f"provisional_patent_{timestamp}.docx")
+            with ThreadPoolExecutor(max_workers=1) as docx_writer:
+                docx_future = docx_writer.submit(self.docx_generator.generate, patent_doc, docx_path)
 
-            # =====================================================
-            # PHASE 7: Score Against Rubric
-            # =====================================================
-            self._report_phase(7, "Scoring against 100-point rubric...")
+                # =====================================================
+                # PHASE 7: Score Against Rubric
+                # =====================================================
+                self._report_phase(7, "Scoring against 100-point rubric...")
+
+                self.score_result = self.scorer.score(patent_doc)
 
-            self.score_result = self.scorer.score(patent_doc)
+                docx_future.result()
+            print(f"  Created: {docx_path}")
 
             # Save score report
-            score_report_path = os.path.join(output_dir, "score_report.json")
-            with open(score_report_path, 'w') as f:
-                json.dump({
-                    "score": self.score_result.total_score,
-                    "grade": self.score_result.grade,
-                    "category_scores": self.score_result.category_scores,
-                    "deductions": self.score_result.deductions,
-                    "bonuses": self.score_result.bonuses,
-                    "recommendations": self.score_result.recommendations
-                }, f, indent=2)
+            score_report_path = str(output_path / "score_report.json")
+            report = {
+                "score": self.score_result.total_score,
+                "grade": self.score_result.grade,
+                "category_scores": self.score_result.category_scores,
+                "deductions": self.score_result.deductions,
+                "bonuses": self.score_result.bonuses,
+                "recommendations": self.score_result.recommendations
+            }
+            if orjson is not None:
+                with open(score_report_path, 'wb') as f:
+                    f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(score_report_path, 'w') as f:
+                    json.dump(report, f, indent=2)
 
             print(f"  Score: {self.score_result.total_score}/100 - {self.score_result.grade}")
 
@@ -357,6 +439,8 @@ class UnifiedPatentPipeline:
 
         context_text = self._build_context_text()
 
+        # The prompt embeds the truncated context, so with the AI cache enabled
+        # an unchanged source reuses the previous analysis without a call
         prompt = f"""Analyze this source code for patentable AI/software innovations:
 
 {context_text[:20000]}
@@ -421,7 +505,6 @@ Be thorough - focus on technical HOW, not business WHAT."""
         all_research = []
 
         # PASS 1: Core Patent Search
-        print("    Pass 1/5: Searching USPTO patent database...")
         pass1_prompt = f"""Search for USPTO patents related to this invention:
 
 {innovation_summary}
@@ -430,57 +513,51 @@ Search PatentsView for relevant patents. Focus on CPC: G06N (AI), G06F (Computin
 List 5-10 patent numbers (US XXXXXXXX A1/B2), titles, assignees.
 Identify CLOSEST prior art and explain technical differences."""
 
-        try:
-            response = self.ai.research(pass1_prompt)
-            if response.success:
-                all_research.append("## USPTO Patent Search\n" + response.content)
-        except Exception as e:
-            all_research.append(f"USPTO search error: {e}")
-
         # PASS 2: Academic Papers
-        print("    Pass 2/5: Searching academic publications...")
         pass2_prompt = f"""Search for academic papers related to:
 
 {innovation_summary[:3000]}
 
 Search arXiv, ACM, IEEE, Google Scholar. List 5-8 papers from 2022-2025 with titles, authors, contributions."""
 
-        try:
-            response = self.ai.research(pass2_prompt)
-            if response.success:
-                all_research.append("\n\n## Academic Research\n" + response.content)
-        except Exception as e:
-            all_research.append(f"Academic search error: {e}")
-
         # PASS 3: Competitive Landscape
-        print("    Pass 3/5: Analyzing competitive landscape...")
         pass3_prompt = f"""Analyze competitive landscape for:
 
 {innovation_summary[:2000]}
 
 Find existing products, competitors, open-source projects. Identify market leaders and white space."""
 
-        try:
-            response = self.ai.research(pass3_prompt)
-            if response.success:
-                all_research.append("\n\n## Competitive Landscape\n" + response.content)
-        except Exception as e:
-            all_research.append(f"Competitive analysis error: {e}")
-
         # PASS 4: International Patents
-        print("    Pass 4/5: Searching international patents...")
         pass4_prompt = f"""Search international patents for:
 
 {innovation_summary[:2000]}
 
 Search EPO, WIPO, JPO, CNIPA. List 3-5 patents with numbers, titles. Identify patent families."""
 
-        try:
-            response = self.ai.research(pass4_prompt)
-            if response.success:
-                all_research.append("\n\n## International Patents\n" + response.content)
-        except Exception as e:
-            all_research.append(f"International search error: {e}")
+        # (progress message, section heading, error label, prompt)
+        passes = [
+            ("Pass 1/5: Searching USPTO patent database...",
+             "## USPTO Patent Search\n", "USPTO search error", pass1_prompt),
+            ("Pass 2/5: Searching academic publications...",
+             "\n\n## Academic Research\n", "Academic search error", pass2_prompt),
+            ("Pass 3/5: Analyzing competitive landscape...",
+             "\n\n## Competitive Landscape\n", "Competitive analysis error", pass3_prompt),
+            ("Pass 4/5: Searching international patents...",
+             "\n\n## International Patents\n", "International search error", pass4_prompt),
+        ]
+
+        # Passes 1-4 are independent, so their round-trips overlap; results
+        # are collected in pass order so the research text is deterministic.
+        # Each call is bounded by the provider's HTTP timeout.
+        with ThreadPoolExecutor(max_workers=len(passes)) as pool:
+            futures = []
+            for message, heading, error_label, prompt in passes:
+                print(f"    {message}")
+                futures.append(pool.submit(self._run_research_pass, heading, error_label, prompt))
+        for future in futures:
+            section = future.result()
+            if section is not None:
+                all_research.append(section)
 
         # PASS 5: Novelty Analysis
         print("    Pass 5/5: Synthesizing novelty analysis...")
@@ -517,20 +594,24 @@ Analyze: 1) Novelty (1-10 scale), 2) Non-obviousness, 3) Key differentiators (5-
             "perplexity_pro": True
         }
 
+    def _run_research_pass(self, heading: str, error_label: str, prompt: str) -> Optional[str]:
+        """Run one research pass; returns its section text, or None if unsuccessful"""
+        try:
+            response = self.ai.research(prompt)
+            if response.success:
+                return heading + response.content
+        except Exception as e:
+            return f"{error_label}: {e}"
+        return None
+
     def _extract_patent_numbers(self, text: str) -> List[str]:
         """Extract patent numbers from research text"""
-        import re
-        patterns = [r'US\s*\d{7,8}\s*[AB]\d?', r'EP\s*\d{7}', r'WO\s*\d{4}/\d{6}']
-        patents = []
-        for p in patterns:
-            patents.extend(re.findall(p, text, re.IGNORECASE))
-        return list(set(patents))[:20]
+        return list(set(_PATENT_NUMBER_RE.findall(text)))[:20]
 
     def _extract_differentiation_points(self, text: str) -> List[str]:
         """Extract differentiation points from analysis"""
-        import re
-        points = re.findall(r'\d+\.\s+([^\n]{10,100})', text)
-        points.extend(re.findall(r'[-*]\s+([^\n]{10,100})', text))
+        points = _NUMBERED_POINT_RE.findall(text)
+        points.extend(_BULLET_POINT_RE.findall(text))
         return list(set(points))[:8]
 
     def _generate_title(self) -> str:
@@ -538,12 +619,10 @@ Analyze: 1) Novelty (1-10 scale), 2) Non-obviousness, 3) Key differentiators (5-
         if not self.source_context:
             return "System and Method for Improved Data Processing"
 
-        base_name = self.source_context.source_name
-        base_name = base_name.replace("-", " ").replace("_", " ").title()
+        base_name = self.source_context.source_name.translate(_TITLE_TRANS).title()
 
         # Clean up common words
-        for word in ["Tool", "App", "Application", "Project", "V1", "V2"]:
-            base_name = base_name.replace(word, "")
+        base_name = _TITLE_NOISE_RE.sub("", base_name)
 
         return f"System and Method for {base_name.strip()}"
 
@@ -567,10 +646,10 @@ Analyze: 1) Novelty (1-10 scale), 2) Non-obviousness, 3) Key differentiators (5-
             parts.append(self.source_context.summary)
 
             # Include key files
-            for f in self.source_context.files[:15]:
-                lang = f.language.lower() if f.language else ''
-                parts.append(f"\n### {f.path}\n```{lang}")
-                parts.append(f.content[:4000])
+            for path, language, text in self.source_context.truncated_files[:15]:
+                lang = language.lower() if language else ''
+                parts.append(f"\n### {path}\n```{lang}")
+                parts.append(text[:4000])
                 parts.append("```")
 
         return "\n".join(parts)
@@ -579,39 +658,27 @@ Analyze: 1) Novelty (1-10 scale), 2) Non-obviousness, 3) Key differentiators (5-
         """Build text representation of source context"""
         if not self.source_context:
             return ""
+        if self._context_text and self._context_text[0] is self.source_context:
+            return self._context_text[1]
 
         parts = [self.source_context.summary]
 
-        for f in self.source_context.files[:25]:
-            parts.append(f"\n--- {f.path} ---")
-            parts.append(f.content[:6000])
+        for path, _, text in self.source_context.truncated_files:
+            parts.append(f"\n--- {path} ---")
+            parts.append(text)
 
-        return "\n".join(parts)
+        text = "\n".join(parts)
+        self._context_text = (self.source_context, text)
+        return text
 
-    def _generate_figures(self, title: str, description: str) -> List[PatentFigure]:
+    def _generate_figures(self, title: str, description: str,
+                          figure_specs: Optional[Tuple] = None) -> List["PatentFigure"]:
         """Phase 5: Generate patent figures"""
+        PatentFigure = _import_module("docx_generator").PatentFigure
         figures = []
 
-        # Generate 5 standard figures (placeholders for now)
-        figure_specs = [
-            (1, "System Architecture", "illustrates a system 100 according to various embodiments.",
-             {100: "System", 101: "Client Interface", 102: "Processing Engine",
-              103: "Data Store", 104: "Network Interface"}),
-            (2, "Hardware Block Diagram", "illustrates a computing device 200 suitable for implementing aspects of the invention.",
-             {200: "Computing Device", 201: "Processor", 202: "Memory",
-              203: "Storage", 204: "Network Interface", 205: "I/O Controller"}),
-            (3, "Method Flowchart", "is a flowchart illustrating a method 300 according to various embodiments.",
-             {300: "Method", 302: "Receive Input", 304: "Process Data",
-              306: "Generate Output", 308: "End"}),
-            (4, "Data Flow Diagram", "illustrates data flow 400 through the system according to various embodiments.",
-             {400: "Data Flow", 401: "Raw Input", 402: "Preprocessing",
-              403: "Core Processing", 404: "Output Generation"}),
-            (5, "Alternative Embodiment", "illustrates an alternative implementation 500 according to various embodiments.",
-             {500: "Alternative System", 501: "Distributed Nodes",
-              502: "Central Coordinator", 503: "Results Aggregation"})
-        ]
-
-        for fig_num, fig_title, fig_desc, ref_nums in figure_specs:
+        # Generate the standard figures (placeholders for now)
+        for fig_num, fig_title, fig_desc, ref_nums in figure_specs or self.FIGURE_SPECS:
             # Create placeholder figure
             figures.append(PatentFigure(
                 figure_number=fig_num,
@@ -619,14 +686,28 @@ Analyze: 1) Novelty (1-10 scale), 2) Non-obviousness, 3) Key differentiators (5-
                 description=f"FIG. {fig_num} {fig_desc}",
                 image_data=b'',  # Placeholder - would be generated by Krea AI
                 image_format='png',
-                reference_numerals=ref_nums
+                reference_numerals=dict(ref_nums)
             ))
 
         return figures
 
+    def _save_figure(self, fig: "PatentFigure", figures_dir: str) -> None:
+        """
+        Write a figure into figures_dir; the .docx then embeds it from the
+        file, so the bytes are released instead of being held until Phase 6
+        """
+        fig_path = os.path.join(
+            figures_dir,
+            f"FIG_{fig.figure_number}_{fig.title.replace(' ', '_')}.{fig.image_format}"
+        )
+        Path(fig_path).write_bytes(fig.image_data)
+        fig.image_path = fig_path
+        fig.image_data = b''
+
     def cleanup(self):
         """Clean up resources"""
-        pass  # Add cleanup for Playwright etc. when implemented
+        # Close the HTTP session pooled across the AI providers
+        self.ai.close()
 
 
 def run_patent_pipeline(
@@ -637,7 +718,8 @@ def run_patent_pipeline(
     inventor_state: str = "ST",
     inventor_zip: str = "12345",
     technical_field: str = "artificial intelligence",
-    output_dir: str = None
+    output_dir: str = None,
+    use_cache: bool = False
 ) -> PipelineResult:
     """
     Convenience function to run the complete pipeline.
@@ -647,6 +729,8 @@ def run_patent_pipeline(
         inventor_*: Inventor details
         technical_field: Technical field
         output_dir: Output directory
+        use_cache: Reuse cached AI responses for identical prompts; off by
+            default because the cache keeps prompts and responses on disk
 
     Returns:
         PipelineResult
@@ -671,7 +755,8 @@ def run_patent_pipeline(
         claude_key=ANTHROPIC_API_KEY,
         openai_key=OPENAI_API_KEY,
         perplexity_key=PERPLEXITY_API_KEY,
-        krea_key=KREA_API_KEY
+        krea_key=KREA_API_KEY,
+        use_cache=use_cache
     )
 
     return pipeline.run(
@@ -689,17 +774,21 @@ def run_patent_pipeline(
 if __name__ == "__main__":
     import sys
 
-    if len(sys.argv) < 2:
-        print("Usage: python unified_pipeline.py <source_path> [inventor_name]")
+    # --cache reuses cached AI responses for identical prompts
+    use_cache = "--cache" in sys.argv
+    args = [a for a in sys.argv[1:] if a != "--cache"]
+
+    if not args:
+        print("Usage: python unified_pipeline.py <source_path> [inventor_name] [--cache]")
         print("\nExamples:")
         print("  python unified_pipeline.py C:/path/to/project")
         print("  python unified_pipeline.py https://github.com/owner/repo")
         sys.exit(1)
 
-    source = sys.argv[1]
-    inventor = sys.argv[2] if len(sys.argv) > 2 else "Inventor Name"
+    source = args[0]
+    inventor = args[1] if len(args) > 1 else "Inventor Name"
 
-    result = run_patent_pipeline(source, inventor_name=inventor)
+    result = run_patent_pipeline(source, inventor_name=inventor, use_cache=use_cache)
 
     if result.success:
         print(f"\nSuccess! Patent generated at: {result.docx_path}")